@@ -50,21 +50,22 @@ st.subheader("Current Privacy Choices")
 
 privacy = st.session_state.privacy
 
-col1, col2 = st.columns(2)
 
-with col1:
-    st.write("**Analytics:**")
-    st.write("Allow basic analytics (helps us improve)")
-    st.write(f"Status: {'✅ Enabled' if privacy['analytics'] else '❌ Disabled'}")
+def status(enabled: bool) -> str:
+    return "✅ Enabled" if enabled else "❌ Disabled"
 
-with col2:
-    st.write("**Save Progress:**")
-    st.write("Save progress for personalized picks")
-    st.write(f"Status: {'✅ Enabled' if privacy['save_progress'] else '❌ Disabled'}")
 
-st.write("**Email Reports:**")
-st.write("Email me weekly reports")
-st.write(f"Status: {'✅ Enabled' if privacy['email_reports'] else '❌ Disabled'}")
+# One markdown block so a toggle re-renders a single element
+st.markdown(f"""
+**Analytics:** Allow basic analytics (helps us improve)  
+Status: {status(privacy['analytics'])}
+
+**Save Progress:** Save progress for personalized picks  
+Status: {status(privacy['save_progress'])}
+
+**Email Reports:** Email me weekly reports  
+Status: {status(privacy['email_reports'])}
+""")
 
 st.markdown("---")
 
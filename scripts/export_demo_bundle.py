@@ -6,24 +6,35 @@ This script creates a zip file containing all generated reports, snapshots,
 and documentation for easy sharing and demonstration.
 """
 
+import argparse
+import os
 import sys
 import zipfile
 from pathlib import Path
-import subprocess
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+def _has_markdown_reports(reports_dir: Path) -> bool:
+    """Return True as soon as one .md report is found in reports_dir."""
+    try:
+        with os.scandir(reports_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".md"):
+                    return True
+    except FileNotFoundError:
+        pass
+    return False
 
 
 def ensure_reports_exist():
     """Ensure reports directory exists and has content."""
     reports_dir = Path("./reports")
     
-    if not reports_dir.exists() or not list(reports_dir.glob("*.md")):
+    if not _has_markdown_reports(reports_dir):
         print("📊 Reports directory empty or missing. Generating reports...")
         
         try:
-            # Import and run the report module in-process
+            # Import and run the report module in-process (src/ only needed here)
+            sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
             from ai_buddy.report import main as report_main
             
             # Set up sys.argv to simulate command line arguments
@@ -45,9 +56,37 @@ def ensure_reports_exist():
     return True
 
 
-def create_demo_bundle():
+def _compression_for(backend: str):
+    """Return (compress_type, compresslevel) for a bundle backend name."""
+    if backend == "zstd":
+        # ZIP_ZSTANDARD only exists on Python 3.14+. Older zipfile cannot
+        # write zstd entries at all (not even from the zstandard package's
+        # output), so fall back to the deflate default there.
+        zstd_type = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if zstd_type is not None:
+            return zstd_type, 3
+        print("⚠️  zstd entries need Python 3.14+; using deflate instead")
+    return zipfile.ZIP_DEFLATED, 1
+
+
+def _sorted_entries(directory: Path) -> list:
+    """Return a directory's entries sorted by name, for a reproducible archive order."""
+    with os.scandir(directory) as it:
+        return sorted(it, key=lambda e: e.name)
+
+
+def _add_file(zipf, path, arcname: str, compress_type: int, compresslevel=None):
+    """Add a file from its bytes with a fixed ZipInfo, skipping zipfile's stat."""
+    info = zipfile.ZipInfo(arcname)
+    info.external_attr = 0o644 << 16
+    with open(path, 'rb') as f:
+        zipf.writestr(info, f.read(), compress_type=compress_type, compresslevel=compresslevel)
+
+
+def create_demo_bundle(backend: str = "deflate"):
     """Create the demo bundle zip file."""
     bundle_path = Path("./demo_bundle.zip")
+    compress_type, compresslevel = _compression_for(backend)
     
     # Remove existing bundle if it exists
     if bundle_path.exists():
@@ -55,28 +94,33 @@ def create_demo_bundle():
     
     print("📦 Creating demo bundle...")
     
-    with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    # Level 1 deflate (or zstd level 3) is nearly as small as the slow levels
+    # for markdown/JSON at a fraction of the CPU; tiny snapshot/info entries
+    # are stored as-is.
+    with zipfile.ZipFile(bundle_path, 'w', compress_type, compresslevel=compresslevel) as zipf:
         # Add reports
         reports_dir = Path("./reports")
         if reports_dir.exists():
-            for file_path in reports_dir.glob("*"):
-                if file_path.is_file():
-                    arcname = f"reports/{file_path.name}"
-                    zipf.write(file_path, arcname)
+            # DirEntry caches file type from the directory read, so no extra stat
+            for entry in _sorted_entries(reports_dir):
+                if entry.is_file(follow_symlinks=False):
+                    arcname = f"reports/{entry.name}"
+                    _add_file(zipf, entry.path, arcname, compress_type, compresslevel)
                     print(f"   📄 Added: {arcname}")
         
         # Add snapshots
         snapshots_dir = Path("./data/snapshots")
         if snapshots_dir.exists():
-            for file_path in snapshots_dir.glob("*.json"):
-                arcname = f"snapshots/{file_path.name}"
-                zipf.write(file_path, arcname)
-                print(f"   📊 Added: {arcname}")
+            for entry in _sorted_entries(snapshots_dir):
+                if entry.name.endswith(".json"):
+                    arcname = f"snapshots/{entry.name}"
+                    _add_file(zipf, entry.path, arcname, zipfile.ZIP_STORED)
+                    print(f"   📊 Added: {arcname}")
         
         # Add README
         readme_path = Path("./README.md")
         if readme_path.exists():
-            zipf.write(readme_path, "README.md")
+            _add_file(zipf, readme_path, "README.md", compress_type, compresslevel)
             print(f"   📖 Added: README.md")
         
         # Add project structure info
@@ -94,7 +138,9 @@ To use:
 4. Check snapshots/ for child progress data
 """
         
-        zipf.writestr("BUNDLE_INFO.txt", project_info)
+        info = zipfile.ZipInfo("BUNDLE_INFO.txt")
+        info.external_attr = 0o644 << 16
+        zipf.writestr(info, project_info.encode("utf-8"), compress_type=zipfile.ZIP_STORED)
         print(f"   ℹ️  Added: BUNDLE_INFO.txt")
     
     return bundle_path
@@ -102,6 +148,11 @@ To use:
 
 def main():
     """Main function to create demo bundle."""
+    parser = argparse.ArgumentParser(description="Export AI Buddy demo bundle")
+    parser.add_argument("--backend", choices=["deflate", "zstd"], default="deflate",
+                        help="Compression backend for reports (zstd needs Python 3.14+, otherwise deflate is used)")
+    args = parser.parse_args()
+    
     print("🎁 Creating AI Buddy Demo Bundle")
     print("=" * 40)
     
@@ -112,7 +163,7 @@ def main():
             sys.exit(1)
         
         # Create the bundle
-        bundle_path = create_demo_bundle()
+        bundle_path = create_demo_bundle(args.backend)
         
         # Print summary
         print("\n" + "=" * 40)
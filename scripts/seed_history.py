@@ -8,7 +8,9 @@ to populate the history with demo data for testing and demonstration.
 
 import sys
 from datetime import datetime, timedelta
+from multiprocessing import Pool
 from pathlib import Path
+from typing import Optional
 import random
 
 # Add src to path for imports
@@ -19,7 +21,12 @@ from ai_buddy.persist import load_history, save_history
 from ai_buddy.session import SessionLog, ActivityAttempt
 
 
-def generate_demo_attempts(child_id: str, activities: list, num_attempts: int = 4) -> list[ActivityAttempt]:
+def generate_demo_attempts(
+    child_id: str,
+    activities: list,
+    num_attempts: int = 4,
+    rng: Optional[random.Random] = None
+) -> list[ActivityAttempt]:
     """
     Generate demo activity attempts for a child.
     
@@ -27,45 +34,44 @@ def generate_demo_attempts(child_id: str, activities: list, num_attempts: int =
         child_id: ID of the child
         activities: List of available activities
         num_attempts: Number of attempts to generate
+        rng: Random generator to draw from (default: the random module's)
         
     Returns:
         List of ActivityAttempt objects
     """
+    # The random module's functions draw from its shared global generator
+    rng = random if rng is None else rng
     attempts = []
     
-    # Get timestamps in the last 7 days
+    # Get timestamps in the last 7 days, oldest first
     now = datetime.now()
-    timestamps = []
-    for i in range(num_attempts):
-        # Random time in last 7 days
-        days_ago = random.uniform(0, 7)
-        hours_ago = random.uniform(0, 24)
-        timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-        timestamps.append(timestamp)
-    
-    # Sort timestamps (oldest first)
-    timestamps.sort()
+    window_s = 7 * 86400
+    offsets_s = sorted((rng.random() * window_s for _ in range(num_attempts)), reverse=True)
+    timestamps = [now - timedelta(seconds=s) for s in offsets_s]
     
     # Select activities from different types
     activity_types = ["reading", "math", "spelling", "vocab"]
     selected_activities = []
     
+    by_type: dict[str, list] = {}
+    for a in activities:
+        by_type.setdefault(a.type, []).append(a)
+    
     for activity_type in activity_types:
-        type_activities = [a for a in activities if a.type == activity_type]
-        if type_activities:
-            selected_activities.append(random.choice(type_activities))
+        if activity_type in by_type:
+            selected_activities.append(rng.choice(by_type[activity_type]))
     
     # If we don't have enough activities, add some random ones
-    while len(selected_activities) < num_attempts:
-        selected_activities.append(random.choice(activities))
+    selected_activities.extend(rng.choices(activities, k=max(0, num_attempts - len(selected_activities))))
     
     # Generate attempts
     outcomes = ["success", "partial", "struggle"]
     outcome_weights = [0.4, 0.3, 0.3]  # 40% success, 30% partial, 30% struggle
+    outcome_seq = rng.choices(outcomes, weights=outcome_weights, k=num_attempts)
     
     for i in range(num_attempts):
         activity = selected_activities[i % len(selected_activities)]
-        outcome = random.choices(outcomes, weights=outcome_weights)[0]
+        outcome = outcome_seq[i]
         
         attempt = ActivityAttempt(
             activity_id=activity.id,
@@ -82,6 +88,48 @@ def generate_demo_attempts(child_id: str, activities: list, num_attempts: int =
     return attempts
 
 
+# Below this many children the pool start-up costs more than it saves
+POOL_MIN_CHILDREN = 8
+
+# Activities shared with pool workers once via the initializer
+_worker_activities: list = []
+
+
+def _init_worker(activities: list) -> None:
+    global _worker_activities
+    _worker_activities = activities
+
+
+def _generate_seeded(
+    child_id: str, num_attempts: int, seed: int, activities: Optional[list] = None
+) -> list[ActivityAttempt]:
+    # A private per-task generator keeps output independent of which worker
+    # runs the task and leaves the caller's global random state alone
+    if activities is None:
+        activities = _worker_activities
+    return generate_demo_attempts(child_id, activities, num_attempts, random.Random(seed))
+
+
+def generate_attempts_for_children(children: list, activities: list) -> list[list[ActivityAttempt]]:
+    """
+    Generate 3-5 demo attempts for each child, using a process pool for large batches.
+    
+    Args:
+        children: Child profiles to seed
+        activities: List of available activities
+        
+    Returns:
+        One list of attempts per child, in the same order as children
+    """
+    tasks = [(c.id, random.randint(3, 5), random.getrandbits(32)) for c in children]
+    
+    if len(children) < POOL_MIN_CHILDREN:
+        return [_generate_seeded(*task, activities) for task in tasks]
+    
+    with Pool(initializer=_init_worker, initargs=(activities,)) as pool:
+        return pool.starmap(_generate_seeded, tasks)
+
+
 def main():
     """Main function to seed demo history data."""
     print("🌱 Seeding demo history data...")
@@ -112,11 +160,9 @@ def main():
         new_sessions = []
         total_new_attempts = 0
         
-        for child in children_to_seed:
-            # Generate 3-5 attempts per child
-            num_attempts = random.randint(3, 5)
-            attempts = generate_demo_attempts(child.id, activities, num_attempts)
-            
+        all_attempts = generate_attempts_for_children(children_to_seed, activities)
+        
+        for child, attempts in zip(children_to_seed, all_attempts):
             session = SessionLog(
                 child_id=child.id,
                 attempts=attempts
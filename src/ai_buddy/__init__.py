@@ -30,6 +30,8 @@ from .policy import (
     time_fit,
     recency_penalty,
     total_score,
+    total_score_batch,
+    reload_weights,
     mean,
     normalize_text
 )
@@ -45,7 +47,9 @@ from .session import (
 # Import recommender functions
 from .recommender import (
     recommend_activities,
-    explain_recommendation
+    explain_recommendation,
+    explain_scores,
+    Explanation
 )
 
 # Import evaluation functions
@@ -59,11 +63,12 @@ from .evaluate import (
 from .persist import (
     save_history,
     load_history,
-    save_child_snapshot
+    save_child_snapshot,
+    HistoryStore
 )
 
 # Import simulation functions
-from .simulate import answer
+from .simulate import answer, answer_batch
 
 # Import buddy functions
 from .buddy import run_session, run_session_once
@@ -89,6 +94,8 @@ __all__ = [
     "time_fit",
     "recency_penalty",
     "total_score",
+    "total_score_batch",
+    "reload_weights",
     "mean",
     "normalize_text",
     "ActivityAttempt",
@@ -97,13 +104,17 @@ __all__ = [
     "append_attempt",
     "recommend_activities",
     "explain_recommendation",
+    "explain_scores",
+    "Explanation",
     "eval_qna",
     "eval_freeform",
     "choose_outcome_from_eval",
     "save_history",
     "load_history",
     "save_child_snapshot",
+    "HistoryStore",
     "answer",
+    "answer_batch",
     "run_session",
     "run_session_once",
 ]
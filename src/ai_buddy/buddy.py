@@ -6,47 +6,111 @@ evaluation, and progress tracking.
 """
 
 import argparse
+import functools
+import os
+import sys
 from datetime import datetime
 from typing import Optional, Tuple
 
 from .data_models import Activity, ChildProfile
 from .loader import load_activities, load_profiles
-from .persist import load_history
+from .persist import load_history, save_history, save_child_snapshot
 from .recommender import recommend_activities
 from .evaluate import eval_qna, eval_freeform, choose_outcome_from_eval
 from .session import ActivityAttempt, append_attempt
-from .persist import save_history, save_child_snapshot
 from .simulate import answer
 
 
-def clamp(value: float, min_val: float, max_val: float) -> float:
-    """Clamp a value between min and max."""
-    return max(min_val, min(value, max_val))
+# Skill adjustment applied to each of an activity's skills, per outcome
+SKILL_DELTAS = {
+    "success": 0.03,
+    "partial": 0.01,
+    "struggle": -0.01,
+    "skipped": 0.0
+}
+
+
+def _apply_delta(skills: dict[str, float], skill_names: list[str], delta: float) -> None:
+    """Shift each named skill by delta in place, clamped to [0, 1]."""
+    if delta == 0.0:
+        return
+    get = skills.get
+    for skill in skill_names:
+        value = get(skill, 0.5) + delta
+        skills[skill] = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+
+def _index_profiles(profiles: list[ChildProfile]) -> dict[str, ChildProfile]:
+    # Keep the first profile for a repeated id, matching a linear scan
+    index: dict[str, ChildProfile] = {}
+    for p in profiles:
+        index.setdefault(p.id, p)
+    return index
+
+
+@functools.lru_cache(maxsize=4)
+def _load_profiles_at(path: str, mtime_ns: int) -> Tuple[list[ChildProfile], dict[str, ChildProfile]]:
+    profiles = load_profiles(path)
+    return profiles, _index_profiles(profiles)
+
+
+def _cached_load_profiles(path: str) -> Tuple[list[ChildProfile], dict[str, ChildProfile]]:
+    """Load profiles and their id index, reusing both until the file changes."""
+    path = os.path.abspath(path)
+    return _load_profiles_at(path, os.stat(path).st_mtime_ns)
+
+
+def clear_caches() -> None:
+    """Drop profiles cached by run_session_once."""
+    _load_profiles_at.cache_clear()
+
+
+_INTRO_TEMPLATES = {
+    "math": "Let's solve some math! {}",
+    "spelling": "Time to practice spelling! {}",
+    "storytelling": "Ready to tell a story? {}",
+    "reading": "Let's read together! {}",
+    "vocab": "Vocabulary time! {}",
+    "logic": "Let's think logically! {}",
+    "creativity": "Time to be creative! {}"
+}
+
+_ENCOURAGEMENTS = {
+    "success": ("Great job! You did amazing!", "Keep up this excellent work!"),
+    "partial": ("Good effort! You're on the right track.", "Try to add a bit more detail next time."),
+    "struggle": ("Don't worry, learning takes time!", "Let's practice this skill more together."),
+    "skipped": ("That's okay, we can try again later.", "Sometimes it's good to take a break.")
+}
 
 
 def get_activity_intro(activity: Activity) -> str:
     """Generate a friendly introduction for an activity."""
-    intros = {
-        "math": f"Let's solve some math! {activity.title}",
-        "spelling": f"Time to practice spelling! {activity.title}",
-        "storytelling": f"Ready to tell a story? {activity.title}",
-        "reading": f"Let's read together! {activity.title}",
-        "vocab": f"Vocabulary time! {activity.title}",
-        "logic": f"Let's think logically! {activity.title}",
-        "creativity": f"Time to be creative! {activity.title}"
-    }
-    return intros.get(activity.type, f"Let's do this activity: {activity.title}")
+    return _INTRO_TEMPLATES.get(activity.type, "Let's do this activity: {}").format(activity.title)
 
 
 def get_encouragement_and_tip(outcome: str) -> tuple[str, str]:
     """Get encouragement and tip based on outcome."""
-    encouragements = {
-        "success": ("Great job! You did amazing!", "Keep up this excellent work!"),
-        "partial": ("Good effort! You're on the right track.", "Try to add a bit more detail next time."),
-        "struggle": ("Don't worry, learning takes time!", "Let's practice this skill more together."),
-        "skipped": ("That's okay, we can try again later.", "Sometimes it's good to take a break.")
-    }
-    return encouragements.get(outcome, ("Well done!", "Keep practicing!"))
+    return _ENCOURAGEMENTS.get(outcome, ("Well done!", "Keep practicing!"))
+
+
+def _read_freeform_answer() -> str:
+    """Read a multi-line answer ending at a blank line (or end of input)."""
+    print("Please write your response (press Enter twice when done):")
+    lines = []
+    if not sys.stdin.isatty():
+        # Piped input: iterate the buffered stream instead of one input() per line
+        for line in sys.stdin:
+            line = line.rstrip("\n")
+            if line == "" and lines:
+                break
+            lines.append(line)
+        return "\n".join(lines)
+    while True:
+        line = input()
+        if line == "" and lines:  # Empty line after content
+            break
+        lines.append(line)
+    return "\n".join(lines)
 
 
 def run_session_once(
@@ -69,16 +133,20 @@ def run_session_once(
     Returns:
         Tuple of (updated_child, history_delta) where history_delta is the new attempts
     """
-    # Load data if not provided
+    # Load data if not provided. Profiles are read-only here and cached across
+    # calls (load_activities caches on its own); history is mutated by
+    # append_attempt, so it is not.
     if activities is None:
         activities = load_activities("data/activities.json")
     if profiles is None:
-        profiles = load_profiles("data/profiles.json")
+        profiles, profiles_by_id = _cached_load_profiles("data/profiles.json")
+    else:
+        profiles_by_id = _index_profiles(profiles)
     if history is None:
         history = load_history("data/history.json")
     
     # Find child
-    child = next((p for p in profiles if p.id == child_id), None)
+    child = profiles_by_id.get(child_id)
     if not child:
         raise ValueError(f"Child with ID '{child_id}' not found!")
     
@@ -97,14 +165,7 @@ def run_session_once(
         if activity.format == "qna":
             user_answer = input("Your answer: ")
         else:  # freeform
-            print("Please write your response (press Enter twice when done):")
-            lines = []
-            while True:
-                line = input()
-                if line == "" and lines:  # Empty line after content
-                    break
-                lines.append(line)
-            user_answer = "\n".join(lines)
+            user_answer = _read_freeform_answer()
     
     # Evaluate
     if activity.format == "qna":
@@ -128,22 +189,11 @@ def run_session_once(
     # Update history
     new_history = append_attempt(history, child.id, attempt)
     
-    # Apply skill adaptation
-    delta_map = {
-        "success": 0.03,
-        "partial": 0.01,
-        "struggle": -0.01,
-        "skipped": 0.0
-    }
-    delta = delta_map.get(outcome, 0.0)
+    # Copy the child without re-validating; only the skills dict is mutated below
+    updated_child = child.model_copy(update={"baseline_skills": dict(child.baseline_skills)})
     
-    # Create a copy of the child for modification
-    updated_child = ChildProfile.model_validate(child.model_dump())
-    
-    for skill in activity.skills:
-        current_skill = updated_child.baseline_skills.get(skill, 0.5)
-        new_skill = clamp(current_skill + delta, 0.0, 1.0)
-        updated_child.baseline_skills[skill] = new_skill
+    # Apply skill adaptation
+    _apply_delta(updated_child.baseline_skills, activity.skills, SKILL_DELTAS.get(outcome, 0.0))
     
     # Return updated child and the new attempt
     history_delta = [attempt]
@@ -172,6 +222,8 @@ def run_session(
     
     # Select child
     if child_id:
+        # One lookup in a freshly loaded list: a scan that stops at the match
+        # is cheaper than building an index
         child = next((p for p in profiles if p.id == child_id), None)
         if not child:
             print(f"❌ Child with ID '{child_id}' not found!")
@@ -197,6 +249,10 @@ def run_session(
     print(f"✨ I found {len(recommended)} great activities for you!")
     print()
     
+    # Local aliases for the per-activity loop
+    now = datetime.now
+    append = append_attempt
+    
     # Run through each activity
     for i, activity in enumerate(recommended, 1):
         print(f"--- Activity {i}/{len(recommended)} ---")
@@ -213,14 +269,7 @@ def run_session(
             if activity.format == "qna":
                 user_answer = input("Your answer: ")
             else:  # freeform
-                print("Please write your response (press Enter twice when done):")
-                lines = []
-                while True:
-                    line = input()
-                    if line == "" and lines:  # Empty line after content
-                        break
-                    lines.append(line)
-                user_answer = "\n".join(lines)
+                user_answer = _read_freeform_answer()
         
         print()
         
@@ -235,7 +284,7 @@ def run_session(
         # Create activity attempt
         attempt = ActivityAttempt(
             activity_id=activity.id,
-            timestamp=datetime.now(),
+            timestamp=now(),
             outcome=outcome,
             details={
                 "eval": eval_result,
@@ -244,21 +293,10 @@ def run_session(
         )
         
         # Update history
-        history = append_attempt(history, child.id, attempt)
+        history = append(history, child.id, attempt)
         
         # Apply skill adaptation
-        delta_map = {
-            "success": 0.03,
-            "partial": 0.01,
-            "struggle": -0.01,
-            "skipped": 0.0
-        }
-        delta = delta_map.get(outcome, 0.0)
-        
-        for skill in activity.skills:
-            current_skill = child.baseline_skills.get(skill, 0.5)
-            new_skill = clamp(current_skill + delta, 0.0, 1.0)
-            child.baseline_skills[skill] = new_skill
+        _apply_delta(child.baseline_skills, activity.skills, SKILL_DELTAS.get(outcome, 0.0))
         
         # Print feedback
         encouragement, tip = get_encouragement_and_tip(outcome)
@@ -6,10 +6,17 @@ supporting both Q&A and freeform text formats.
 """
 
 from __future__ import annotations
-from typing import Literal, Any, Union
+import functools
+import re
+import weakref
+from typing import Literal, Any, Dict, Tuple, Union
 from .data_models import Activity, ChildProfile
 
 
+# A sentence is a period-delimited run containing at least one non-space character
+_SENTENCE_RE = re.compile(r"[^.]*[^.\s][^.]*")
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for case-insensitive comparison.
@@ -23,6 +30,37 @@ def normalize_text(text: str) -> str:
     return text.lower().strip()
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalized_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Keyed by content, so edits to a rubric's keyword list are picked up.
+    # Duplicates are kept: each listed keyword counts as its own hit.
+    return tuple(normalize_text(k) for k in keywords)
+
+
+# Compiled Q&A answers per live Activity, keyed by id() and dropped when the
+# activity is garbage collected (rubric dicts make Activity unhashable)
+_compiled_answers_by_id: Dict[int, Tuple[Tuple[Union[int, float], ...], Dict[str, str]]] = {}
+
+
+def _compile_answers(activity: Activity) -> Tuple[Tuple[Union[int, float], ...], Dict[str, str]]:
+    """Return the activity's numeric and normalized string answers, cached on first use."""
+    key = id(activity)
+    compiled = _compiled_answers_by_id.get(key)
+    if compiled is None:
+        # Numeric answers keep their order so the first one within tolerance
+        # is reported; strings map normalized form -> first original spelling
+        answers = activity.rubric.get("answers", [])
+        numeric = tuple(a for a in answers if isinstance(a, (int, float)))
+        strings: Dict[str, str] = {}
+        for a in answers:
+            if isinstance(a, str):
+                strings.setdefault(normalize_text(a), a)
+        compiled = (numeric, strings)
+        _compiled_answers_by_id[key] = compiled
+        weakref.finalize(activity, _compiled_answers_by_id.pop, key, None)
+    return compiled
+
+
 def eval_qna(answer: Union[str, float, int], activity: Activity) -> dict[str, Any]:
     """
     Evaluate a Q&A activity response.
@@ -55,26 +93,25 @@ def eval_qna(answer: Union[str, float, int], activity: Activity) -> dict[str, An
     # Get numeric tolerance for numeric answers
     numeric_tolerance = rubric.get("numeric_tolerance", 0.0)
     
-    # Check if answer is correct
+    # Check if answer is correct against the answers compiled for this rubric
     correct = False
     reason = ""
+    numeric_answers, string_answers = _compile_answers(activity)
     
-    for acceptable in acceptable_answers:
-        # Handle numeric comparison
-        if isinstance(acceptable, (int, float)) and isinstance(answer, (int, float)):
+    # Handle numeric comparison
+    if isinstance(answer, (int, float)):
+        for acceptable in numeric_answers:
             if abs(answer - acceptable) <= numeric_tolerance:
                 correct = True
                 reason = f"Answer {answer} matches acceptable answer {acceptable} within tolerance {numeric_tolerance}"
                 break
-        
-        # Handle string comparison
-        elif isinstance(acceptable, str) and isinstance(answer, str):
-            normalized_answer = normalize_text(answer)
-            normalized_acceptable = normalize_text(acceptable)
-            if normalized_answer == normalized_acceptable:
-                correct = True
-                reason = f"Answer '{answer}' matches acceptable answer '{acceptable}'"
-                break
+    
+    # Handle string comparison
+    elif isinstance(answer, str):
+        acceptable = string_answers.get(normalize_text(answer))
+        if acceptable is not None:
+            correct = True
+            reason = f"Answer '{answer}' matches acceptable answer '{acceptable}'"
     
     if not correct:
         reason = f"Answer '{answer}' does not match any acceptable answers: {acceptable_answers}"
@@ -113,9 +150,9 @@ def eval_freeform(text: str, activity: Activity) -> dict[str, Any]:
     # Get minimum sentences requirement
     min_sentences = rubric.get("min_sentences", 3)
     
-    # Count sentences (split by periods, remove empty segments)
-    sentences = [s.strip() for s in text.split(".") if s.strip()]
-    sentence_count = len(sentences)
+    # Count sentences (period-delimited, ignoring blank segments) without
+    # materializing the split pieces
+    sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
     meets_min_length = sentence_count >= min_sentences
     
     # Check for keywords
@@ -124,8 +161,7 @@ def eval_freeform(text: str, activity: Activity) -> dict[str, Any]:
     
     if keywords:
         normalized_text = normalize_text(text)
-        for keyword in keywords:
-            normalized_keyword = normalize_text(keyword)
+        for normalized_keyword in _normalized_keywords(tuple(keywords)):
             if normalized_keyword in normalized_text:
                 keyword_hits += 1
     
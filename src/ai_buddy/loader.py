@@ -4,13 +4,43 @@ Data loading utilities for AI Buddy.
 This module provides functions for loading and processing data from various sources.
 """
 
+import functools
 import json
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List
-from pydantic import ValidationError
+from typing import Any, Dict, List, Tuple
+from pydantic import TypeAdapter, ValidationError
 
 from .data_models import Activity, ChildProfile
 
+try:
+    import orjson
+except ImportError:  # optional: pip install "ai-buddy[fast]"
+    orjson = None
+
+
+# Built once. The list adapters validate a whole file in one pydantic-core
+# call; the item adapters are only used to report which item failed.
+_ACTIVITY_ADAPTER = TypeAdapter(Activity)
+_PROFILE_ADAPTER = TypeAdapter(ChildProfile)
+_ACTIVITIES_ADAPTER = TypeAdapter(List[Activity])
+_PROFILES_ADAPTER = TypeAdapter(List[ChildProfile])
+
+
+def _validate_items(list_adapter: TypeAdapter, item_adapter: TypeAdapter, data: List[Any], label: str, path: str) -> List[Any]:
+    """Validate a list of records in one call, raising ValueError naming the first bad index."""
+    try:
+        return list_adapter.validate_python(data)
+    except ValidationError as e:
+        i = e.errors()[0]["loc"][0]
+        # Re-validate just the failing item so the message matches per-item validation
+        try:
+            item_adapter.validate_python(data[i])
+        except ValidationError as item_error:
+            e = item_error
+        raise ValueError(f"{label} at index {i} in {path} failed validation: {e}")
+
 
 def load_json(path: str) -> Any:
     """
@@ -32,8 +62,10 @@ def load_json(path: str) -> Any:
         raise FileNotFoundError(f"File not found: {path}")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # One read, then parse from bytes (orjson's C parser when available)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {path}: {e}")
 
@@ -52,20 +84,24 @@ def load_activities(path: str) -> List[Activity]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If validation fails with item index and error details
     """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    # Activities are read-only once loaded, so the validated list is reused
+    # until the file changes; callers get their own list object.
+    return list(_load_activities_cached(path, os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_activities_cached(path: str, abs_path: str, mtime_ns: int, size: int) -> Tuple[Activity, ...]:
     data = load_json(path)
     
     if not isinstance(data, list):
         raise ValueError(f"Expected list of activities in {path}, got {type(data).__name__}")
     
-    activities = []
-    for i, item in enumerate(data):
-        try:
-            activity = Activity(**item)
-            activities.append(activity)
-        except ValidationError as e:
-            raise ValueError(f"Activity at index {i} in {path} failed validation: {e}")
-    
-    return activities
+    return tuple(_validate_items(_ACTIVITIES_ADAPTER, _ACTIVITY_ADAPTER, data, "Activity", path))
 
 
 def load_profiles(path: str) -> List[ChildProfile]:
@@ -82,20 +118,13 @@ def load_profiles(path: str) -> List[ChildProfile]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If validation fails with item index and error details
     """
+    # Not cached: sessions update baseline_skills on loaded profiles in place
     data = load_json(path)
     
     if not isinstance(data, list):
         raise ValueError(f"Expected list of profiles in {path}, got {type(data).__name__}")
     
-    profiles = []
-    for i, item in enumerate(data):
-        try:
-            profile = ChildProfile(**item)
-            profiles.append(profile)
-        except ValidationError as e:
-            raise ValueError(f"Profile at index {i} in {path} failed validation: {e}")
-    
-    return profiles
+    return _validate_items(_PROFILES_ADAPTER, _PROFILE_ADAPTER, data, "Profile", path)
 
 
 def summarize_activities(activities: List[Activity]) -> Dict[str, Any]:
@@ -108,23 +137,13 @@ def summarize_activities(activities: List[Activity]) -> Dict[str, Any]:
     Returns:
         Dictionary with summary statistics
     """
-    summary = {
+    # Counter over a generator counts in C (one pass per field, no Python-level
+    # increments); plain dicts are returned to keep the summary JSON-friendly
+    return {
         "total": len(activities),
-        "by_type": {},
-        "by_level": {}
+        "by_type": dict(Counter(a.type for a in activities)),
+        "by_level": dict(Counter(a.level for a in activities))
     }
-    
-    # Count by type
-    for activity in activities:
-        activity_type = activity.type
-        summary["by_type"][activity_type] = summary["by_type"].get(activity_type, 0) + 1
-    
-    # Count by level
-    for activity in activities:
-        level = activity.level
-        summary["by_level"][level] = summary["by_level"].get(level, 0) + 1
-    
-    return summary
 
 
 def summarize_profiles(profiles: List[ChildProfile]) -> Dict[str, Any]:
@@ -137,23 +156,11 @@ def summarize_profiles(profiles: List[ChildProfile]) -> Dict[str, Any]:
     Returns:
         Dictionary with summary statistics
     """
-    summary = {
+    return {
         "total": len(profiles),
-        "by_reading_level": {},
-        "by_learning_style": {}
+        "by_reading_level": dict(Counter(p.reading_level for p in profiles)),
+        "by_learning_style": dict(Counter(p.learning_style for p in profiles))
     }
-    
-    # Count by reading level
-    for profile in profiles:
-        reading_level = profile.reading_level
-        summary["by_reading_level"][reading_level] = summary["by_reading_level"].get(reading_level, 0) + 1
-    
-    # Count by learning style
-    for profile in profiles:
-        learning_style = profile.learning_style
-        summary["by_learning_style"][learning_style] = summary["by_learning_style"].get(learning_style, 0) + 1
-    
-    return summary
 
 
 if __name__ == "__main__":
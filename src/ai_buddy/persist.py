@@ -7,14 +7,23 @@ and child profile snapshots to/from JSON files.
 
 from __future__ import annotations
 from pathlib import Path
-import json
+import logging
 import tempfile
-import shutil
-from typing import Any
+import os
+import threading
+from typing import List, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError
 from .session import SessionLog, ActivityAttempt
 from .data_models import ChildProfile
 
 
+# Serializes and parses a whole history straight to/from JSON in
+# pydantic-core, without building intermediate dicts
+_HISTORY_ADAPTER = TypeAdapter(List[SessionLog])
+
+logger = logging.getLogger(__name__)
+
+
 def save_history(history: list[SessionLog], path: str = "data/history.json") -> None:
     """
     Save session history to a JSON file.
@@ -31,22 +40,19 @@ def save_history(history: list[SessionLog], path: str = "data/history.json") ->
     # Ensure parent directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Convert to JSON-serializable format
-    history_data = [session.model_dump() for session in history]
-    
     # Atomic write: write to temp file first, then replace
     try:
         with tempfile.NamedTemporaryFile(
-            mode='w', 
+            mode='wb', 
             suffix='.json', 
             dir=file_path.parent,
             delete=False
         ) as temp_file:
-            json.dump(history_data, temp_file, indent=2, default=str)
+            temp_file.write(_HISTORY_ADAPTER.dump_json(history, indent=2))
             temp_path = temp_file.name
         
-        # Atomic move
-        shutil.move(temp_path, file_path)
+        # Atomic rename (temp file is in the same directory, so same filesystem)
+        os.replace(temp_path, file_path)
         
     except (OSError, IOError) as e:
         # Clean up temp file if it exists
@@ -77,19 +83,13 @@ def load_history(path: str = "data/history.json") -> list[SessionLog]:
         return []
     
     try:
-        with open(file_path, 'r') as f:
-            history_data = json.load(f)
+        # Parse and validate in one pass into SessionLog objects
+        return _HISTORY_ADAPTER.validate_json(file_path.read_bytes())
         
-        # Validate and convert back to SessionLog objects
-        history = []
-        for session_data in history_data:
-            session = SessionLog.model_validate(session_data)
-            history.append(session)
-        
-        return history
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in {path}: {e}")
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(f"Invalid JSON in {path}: {e}")
+        raise ValueError(f"Failed to load history from {path}: {e}")
     except Exception as e:
         raise ValueError(f"Failed to load history from {path}: {e}")
 
@@ -110,22 +110,19 @@ def save_child_snapshot(child: ChildProfile, path: str) -> None:
     # Ensure parent directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Convert to JSON-serializable format
-    child_data = child.model_dump()
-    
     # Atomic write: write to temp file first, then replace
     try:
         with tempfile.NamedTemporaryFile(
-            mode='w', 
+            mode='wb', 
             suffix='.json', 
             dir=file_path.parent,
             delete=False
         ) as temp_file:
-            json.dump(child_data, temp_file, indent=2, default=str)
+            temp_file.write(child.model_dump_json(indent=2).encode("utf-8"))
             temp_path = temp_file.name
         
-        # Atomic move
-        shutil.move(temp_path, file_path)
+        # Atomic rename (temp file is in the same directory, so same filesystem)
+        os.replace(temp_path, file_path)
         
     except (OSError, IOError) as e:
         # Clean up temp file if it exists
@@ -137,9 +134,148 @@ def save_child_snapshot(child: ChildProfile, path: str) -> None:
         raise OSError(f"Failed to save child snapshot to {path}: {e}")
 
 
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    # (mtime_ns, size), or None if missing or unreadable; changes whenever
+    # the file is rewritten
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class HistoryStore:
+    """
+    In-memory session history backed by a JSON file, with delayed writes.
+    
+    Reads return the current list without re-parsing the file. Changes made
+    through append or replace are visible at once and saved to disk
+    flush_delay seconds later, so a burst of changes is written once. The
+    list returned by get is never modified in place; each change builds a
+    new list (copying any session it extends), so earlier readers keep a
+    consistent snapshot.
+    
+    If the file is rewritten by something else while there are no unsaved
+    changes, the next read reloads it. If it is rewritten while there are
+    unsaved changes, flush refuses to overwrite it and raises instead.
+    
+    A delayed save that fails is logged, kept in last_error, and retried
+    flush_delay seconds later; the changes stay in memory until a save
+    succeeds.
+    """
+    
+    def __init__(self, path: str = "data/history.json", flush_delay: float = 2.0):
+        """
+        Args:
+            path: History file to load from and save to
+            flush_delay: Seconds to wait after a change before saving
+        """
+        self.path = path
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._data = load_history(path)
+        self._sig = _file_sig(path)
+        self._version = 0
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self.last_error: Optional[OSError] = None
+    
+    def get(self) -> List[SessionLog]:
+        """Return the current history; treat it as read-only."""
+        with self._lock:
+            if not self._dirty:
+                sig = _file_sig(self.path)
+                if sig != self._sig:
+                    self._data = load_history(self.path)
+                    self._sig = sig
+                    self._version += 1
+            return self._data
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the history does, e.g. for cache keys."""
+        with self._lock:
+            self.get()
+            return self._version
+    
+    def append(self, child_id: str, attempt: ActivityAttempt) -> None:
+        """
+        Add an attempt to the child's first session, or start a new session.
+        
+        Args:
+            child_id: ID of the child making the attempt
+            attempt: Attempt to add
+        """
+        with self._lock:
+            history = list(self.get())
+            for i, session in enumerate(history):
+                if session.child_id == child_id:
+                    history[i] = session.model_copy(update={"attempts": [*session.attempts, attempt]})
+                    break
+            else:
+                history.append(SessionLog(child_id=child_id, attempts=[attempt]))
+            self._changed(history)
+    
+    def replace(self, history: List[SessionLog]) -> None:
+        """Replace the whole history."""
+        with self._lock:
+            self._changed(list(history))
+    
+    def flush(self) -> None:
+        """
+        Save unsaved changes now.
+        
+        Raises:
+            OSError: If unable to write to the file, or if the file was
+                rewritten by something else since it was last loaded or saved
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            try:
+                if _file_sig(self.path) != self._sig:
+                    raise OSError(
+                        f"{self.path} was changed by another writer; "
+                        "not overwriting it with unsaved history"
+                    )
+                save_history(self._data, self.path)
+            except OSError as e:
+                self.last_error = e
+                raise
+            self._dirty = False
+            self._sig = _file_sig(self.path)
+            self.last_error = None
+    
+    def _changed(self, history: List[SessionLog]) -> None:
+        self._data = history
+        self._dirty = True
+        self._version += 1
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _flush_in_background(self) -> None:
+        # Runs on the timer thread: an exception here would only print a
+        # traceback, so log it and try again later
+        with self._lock:
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error("Failed to save history, retrying in %ss: %s", self.flush_delay, e)
+                self._schedule_flush()
+
+
 # Export the functions
 __all__ = [
     "save_history",
     "load_history", 
-    "save_child_snapshot"
+    "save_child_snapshot",
+    "HistoryStore"
 ]
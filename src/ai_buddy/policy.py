@@ -5,7 +5,11 @@ This module provides functions to score activities based on child profiles,
 learning preferences, and activity history.
 """
 
-from typing import List, Dict, Any, Optional
+import functools
+import weakref
+from collections.abc import Set
+from typing import AbstractSet, List, Dict, Any, Optional, FrozenSet, NamedTuple, Sequence, Tuple, Union
+import numpy as np
 from .data_models import Activity, ChildProfile
 
 
@@ -19,6 +23,28 @@ WEIGHTS = {
     "recency_penalty": 0.05
 }
 
+# WEIGHTS bound to module globals so scoring skips the dict lookups;
+# call reload_weights() after changing WEIGHTS
+_W_SKILL = _W_INTEREST = _W_STYLE = _W_LEVEL = _W_TIME = _W_RECENCY = 0.0
+
+
+def reload_weights() -> None:
+    """
+    Rebind the scoring weights from WEIGHTS.
+    
+    WEIGHTS remains the source of truth for tuning, but the scoring functions
+    read module-level copies; call this after editing WEIGHTS.
+    """
+    global _W_SKILL, _W_INTEREST, _W_STYLE, _W_LEVEL, _W_TIME, _W_RECENCY
+    _W_SKILL, _W_INTEREST, _W_STYLE, _W_LEVEL, _W_TIME, _W_RECENCY = (
+        WEIGHTS[k] for k in (
+            "skill_fit", "interest_fit", "style_fit", "level_fit", "time_fit", "recency_penalty"
+        )
+    )
+
+
+reload_weights()
+
 
 def mean(lst: List[float], default: float = 0.0) -> float:
     """
@@ -49,6 +75,82 @@ def normalize_text(s: str) -> str:
     return s.lower().strip()
 
 
+# Separator for joined strings; never appears in tags or interests
+_SEP = "\x00"
+
+
+class _ActivityText(NamedTuple):
+    """Normalized tags of an activity used by the fit functions."""
+    tags: FrozenSet[str]
+    tags_joined: str
+
+
+class _ChildText(NamedTuple):
+    """Normalized interests of a child used by the fit functions."""
+    interests: FrozenSet[str]
+    joined: str
+
+
+@functools.lru_cache(maxsize=1024)
+def _activity_text(tags: Tuple[str, ...]) -> _ActivityText:
+    tag_set = frozenset(normalize_text(tag) for tag in tags)
+    return _ActivityText(tag_set, _SEP.join(tag_set))
+
+
+@functools.lru_cache(maxsize=256)
+def _child_text(interests: Tuple[str, ...]) -> _ChildText:
+    interest_set = frozenset(normalize_text(interest) for interest in interests)
+    return _ChildText(interest_set, _SEP.join(interest_set))
+
+
+# Normalized tags memoized per Activity object (by id, evicted when the object
+# is collected). Activities are frozen and their tags are not edited in place,
+# so an entry stays valid for the object's lifetime; model_copy() yields a new
+# object and a new entry.
+_activity_text_by_id: Dict[int, _ActivityText] = {}
+
+
+def _normalized_activity(activity: Activity) -> _ActivityText:
+    """Return the activity's normalized tags, cached on first use."""
+    key = id(activity)
+    text = _activity_text_by_id.get(key)
+    if text is None:
+        # type/format are Literal fields and already canonical lowercase
+        text = _activity_text(tuple(activity.tags))
+        _activity_text_by_id[key] = text
+        weakref.finalize(activity, _activity_text_by_id.pop, key, None)
+    return text
+
+
+def _normalized_child(child: ChildProfile) -> _ChildText:
+    """Return the child's normalized interests, cached by content."""
+    return _child_text(tuple(child.interests))
+
+
+def _interest_match(activity_type: str, text: _ActivityText, child_text: _ChildText) -> float:
+    interests = child_text.interests
+    if not interests:
+        return 0.4
+    
+    # Exact matches first: plain hash lookups
+    if activity_type in interests or not text.tags.isdisjoint(interests):
+        return 1.0
+    
+    # Fuzzy contains: one substring search per tag/interest over the joined
+    # other side replaces the tag x interest nested loop
+    joined_interests = child_text.joined
+    for tag in text.tags:
+        if tag in joined_interests:
+            return 1.0
+    if text.tags:
+        joined_tags = text.tags_joined
+        for interest in interests:
+            if interest in joined_tags:
+                return 1.0
+    
+    return 0.4
+
+
 def skill_fit(activity: Activity, child: ChildProfile) -> float:
     """
     Calculate skill fit between activity and child.
@@ -86,22 +188,63 @@ def interest_fit(activity: Activity, child: ChildProfile) -> float:
     Returns:
         Interest fit score between 0.0 and 1.0
     """
-    # Normalize all text for case-insensitive comparison
-    activity_type = normalize_text(activity.type)
-    activity_tags = [normalize_text(tag) for tag in activity.tags]
-    child_interests = [normalize_text(interest) for interest in child.interests]
-    
-    # Check if activity type matches any child interest
-    if activity_type in child_interests:
+    # Normalized text is computed once per distinct activity/child content
+    return _interest_match(activity.type, _normalized_activity(activity), _normalized_child(child))
+
+
+# Preferred signals per learning style, built once rather than per call
+_VISUAL_TAGS = frozenset({"visual", "picture", "drawing"})
+_AUDITORY_TYPES = frozenset({"storytelling", "reading"})
+_LOGICAL_TYPES = frozenset({"math", "logic"})
+_LOGICAL_TAGS = frozenset({"puzzles", "reasoning"})
+_KINESTHETIC_TAGS = frozenset({"quick", "applied", "fluency"})
+_FREEFORM = frozenset({"freeform"})
+
+
+# Per-style handlers take (tags, type, format, estimated_min, attention_span_min)
+def _style_fit_visual(tags: FrozenSet[str], activity_type: str, activity_format: str,
+                      estimated_min: int, attention_span_min: int) -> float:
+    # Visual learners prefer visual content and freeform activities
+    if not tags.isdisjoint(_VISUAL_TAGS) or activity_format in _FREEFORM:
         return 1.0
-    
-    # Check if any activity tag matches any child interest (fuzzy contains)
-    for tag in activity_tags:
-        for interest in child_interests:
-            if tag in interest or interest in tag:
-                return 1.0
-    
-    return 0.4
+    return 0.5
+
+
+def _style_fit_auditory(tags: FrozenSet[str], activity_type: str, activity_format: str,
+                        estimated_min: int, attention_span_min: int) -> float:
+    # Auditory learners prefer storytelling, reading, and freeform activities
+    if activity_type in _AUDITORY_TYPES or activity_format in _FREEFORM:
+        return 1.0
+    return 0.5
+
+
+def _style_fit_logical(tags: FrozenSet[str], activity_type: str, activity_format: str,
+                       estimated_min: int, attention_span_min: int) -> float:
+    # Logical learners prefer math, logic, puzzles, and reasoning
+    if activity_type in _LOGICAL_TYPES or not tags.isdisjoint(_LOGICAL_TAGS):
+        return 1.0
+    return 0.5
+
+
+def _style_fit_kinesthetic(tags: FrozenSet[str], activity_type: str, activity_format: str,
+                           estimated_min: int, attention_span_min: int) -> float:
+    # Kinesthetic learners prefer quick, applied activities that fit attention span
+    if not tags.isdisjoint(_KINESTHETIC_TAGS) or estimated_min <= attention_span_min:
+        return 1.0
+    return 0.5
+
+
+def _style_fit_default(tags: FrozenSet[str], activity_type: str, activity_format: str,
+                       estimated_min: int, attention_span_min: int) -> float:
+    return 0.5
+
+
+_STYLE_HANDLERS = {
+    "visual": _style_fit_visual,
+    "auditory": _style_fit_auditory,
+    "logical": _style_fit_logical,
+    "kinesthetic": _style_fit_kinesthetic
+}
 
 
 def style_fit(activity: Activity, child: ChildProfile) -> float:
@@ -121,54 +264,21 @@ def style_fit(activity: Activity, child: ChildProfile) -> float:
     Returns:
         Style fit score between 0.0 and 1.0
     """
-    activity_type = normalize_text(activity.type)
-    activity_tags = [normalize_text(tag) for tag in activity.tags]
-    activity_format = normalize_text(activity.format)
-    
-    if child.learning_style == "visual":
-        # Visual learners prefer visual content and freeform activities
-        preferred_tags = {"visual", "picture", "drawing"}
-        preferred_formats = {"freeform"}
-        
-        if (any(tag in preferred_tags for tag in activity_tags) or 
-            activity_format in preferred_formats):
-            return 1.0
-    
-    elif child.learning_style == "auditory":
-        # Auditory learners prefer storytelling, reading, and freeform activities
-        preferred_types = {"storytelling", "reading"}
-        preferred_formats = {"freeform"}
-        
-        if (activity_type in preferred_types or 
-            activity_format in preferred_formats):
-            return 1.0
-    
-    elif child.learning_style == "logical":
-        # Logical learners prefer math, logic, puzzles, and reasoning
-        preferred_types = {"math", "logic"}
-        preferred_tags = {"puzzles", "reasoning"}
-        
-        if (activity_type in preferred_types or 
-            any(tag in preferred_tags for tag in activity_tags)):
-            return 1.0
-    
-    elif child.learning_style == "kinesthetic":
-        # Kinesthetic learners prefer quick, applied activities that fit attention span
-        preferred_tags = {"quick", "applied", "fluency"}
-        time_fits = activity.estimated_min <= child.attention_span_min
-        
-        if (any(tag in preferred_tags for tag in activity_tags) or 
-            time_fits):
-            return 1.0
-    
-    return 0.5
+    return _STYLE_HANDLERS.get(child.learning_style, _style_fit_default)(
+        _normalized_activity(activity).tags,
+        activity.type,
+        activity.format,
+        activity.estimated_min,
+        child.attention_span_min
+    )
 
 
-def level_fit(activity: Activity, child: ChildProfile) -> float:
+def level_fit(activity: Activity, child: ChildProfile, mean_skill: Optional[float] = None) -> float:
     """
     Calculate difficulty level fit between activity and child.
     
-    Compute child_mean_skill over activity.skills.
+    Compute child_mean_skill over activity.skills (the same value skill_fit
+    returns, so callers that already have it can pass it in).
     - "easy": aligned if mean_skill < 0.6
     - "medium": aligned if 0.6 <= mean_skill <= 0.8
     - "hard": aligned if mean_skill > 0.8
@@ -178,17 +288,14 @@ def level_fit(activity: Activity, child: ChildProfile) -> float:
     Args:
         activity: The activity to score
         child: The child profile
+        mean_skill: Precomputed skill_fit(activity, child), if available
         
     Returns:
         Level fit score between 0.0 and 1.0
     """
     # Calculate mean skill level for the activity's skills
-    skill_scores = []
-    for skill in activity.skills:
-        score = child.baseline_skills.get(skill, 0.5)
-        skill_scores.append(score)
-    
-    mean_skill = mean(skill_scores, default=0.5)
+    if mean_skill is None:
+        mean_skill = skill_fit(activity, child)
     
     # Define skill bands
     if activity.level == "easy":
@@ -236,7 +343,11 @@ def time_fit(activity: Activity, child: ChildProfile) -> float:
     return max(0.5, min(1.0, score))
 
 
-def recency_penalty(activity_id: str, history: List[str], recent_k: int = 2) -> float:
+def recency_penalty(
+    activity_id: str,
+    history: Union[Sequence[str], AbstractSet[str]],
+    recent_k: int = 2
+) -> float:
     """
     Calculate recency penalty for an activity.
     
@@ -244,8 +355,10 @@ def recency_penalty(activity_id: str, history: List[str], recent_k: int = 2) ->
     
     Args:
         activity_id: The activity ID to check
-        history: List of recent activity IDs (most recent first)
-        recent_k: Number of recent activities to check
+        history: Recent activity IDs, either a sequence (most recent first) or
+            a set holding only the recent IDs, e.g. frozenset(recent_activity_ids(...))
+        recent_k: Number of recent activities to check in a sequence; a set
+            is taken as already limited and is tested directly
         
     Returns:
         Recency penalty score (1.0 if recently attempted, 0.0 otherwise)
@@ -253,19 +366,27 @@ def recency_penalty(activity_id: str, history: List[str], recent_k: int = 2) ->
     if not history:
         return 0.0
     
-    # Check if activity_id is in the last recent_k attempts
-    recent_activities = history[:recent_k]
+    # A set is a constant-time membership test; a sequence is cut to the
+    # last recent_k attempts first
+    recent_activities = history if isinstance(history, Set) else history[:recent_k]
     return 1.0 if activity_id in recent_activities else 0.0
 
 
-def total_score(activity: Activity, child: ChildProfile, history: List[str]) -> float:
+def total_score(
+    activity: Activity,
+    child: ChildProfile,
+    history: Union[Sequence[str], AbstractSet[str]],
+    recent_set: Optional[FrozenSet[str]] = None
+) -> float:
     """
     Calculate total recommendation score for an activity.
     
     Args:
         activity: The activity to score
         child: The child profile
-        history: List of recent activity IDs (most recent first)
+        history: Recent activity IDs, as accepted by recency_penalty
+        recent_set: Precomputed set of the recently attempted IDs; when given,
+            it replaces the recency_penalty scan over history
         
     Returns:
         Total recommendation score
@@ -273,23 +394,261 @@ def total_score(activity: Activity, child: ChildProfile, history: List[str]) ->
     skill_score = skill_fit(activity, child)
     interest_score = interest_fit(activity, child)
     style_score = style_fit(activity, child)
-    level_score = level_fit(activity, child)
+    level_score = level_fit(activity, child, mean_skill=skill_score)
     time_score = time_fit(activity, child)
-    recency_penalty_score = recency_penalty(activity.id, history)
+    if recent_set is None:
+        recency_penalty_score = recency_penalty(activity.id, history)
+    else:
+        recency_penalty_score = 1.0 if activity.id in recent_set else 0.0
     
     # Calculate weighted total score
     total = (
-        WEIGHTS["skill_fit"] * skill_score +
-        WEIGHTS["interest_fit"] * interest_score +
-        WEIGHTS["style_fit"] * style_score +
-        WEIGHTS["level_fit"] * level_score +
-        WEIGHTS["time_fit"] * time_score -
-        WEIGHTS["recency_penalty"] * recency_penalty_score
+        _W_SKILL * skill_score +
+        _W_INTEREST * interest_score +
+        _W_STYLE * style_score +
+        _W_LEVEL * level_score +
+        _W_TIME * time_score -
+        _W_RECENCY * recency_penalty_score
     )
     
     return total
 
 
+class ActivityMatrix(NamedTuple):
+    """Child-independent activity features laid out as parallel arrays."""
+    activities: Tuple[Activity, ...]
+    ids: Tuple[str, ...]
+    skill_index: Dict[str, int]
+    skill_counts: np.ndarray   # (N, S) occurrences of each skill per activity
+    skill_totals: np.ndarray   # (N,) number of skills per activity
+    level: np.ndarray          # (N,) 0 = easy, 1 = medium, 2 = hard
+    est_min: np.ndarray        # (N,) estimated minutes
+    style_flags: np.ndarray    # (N, 6) bool, columns as in _STYLE_FLAG_COLUMNS
+    interest_keys: Tuple[Tuple[str, _ActivityText], ...]  # distinct (type, tags)
+    interest_group: np.ndarray  # (N,) row -> index into interest_keys
+    interest_memo: Dict[_ChildText, np.ndarray]  # child interests -> (N,) scores
+    score_memo: Dict[Tuple[Any, ...], Tuple[float, ...]]  # see total_score_batch
+
+
+_LEVEL_CODES = {"easy": 0, "medium": 1, "hard": 2}
+
+# style_flags columns: visual tag, freeform format, auditory type,
+# logical type, logical tag, kinesthetic tag
+_STYLE_FLAG_COLUMNS = 6
+
+
+def build_activity_matrix(activities: List[Activity]) -> ActivityMatrix:
+    """
+    Precompute the child-independent scoring features of activities.
+    
+    Args:
+        activities: The activities to lay out
+        
+    Returns:
+        ActivityMatrix with one row per activity, in the same order
+    """
+    n = len(activities)
+    skill_index: Dict[str, int] = {}
+    for activity in activities:
+        for skill in activity.skills:
+            skill_index.setdefault(skill, len(skill_index))
+    
+    skill_counts = np.zeros((n, len(skill_index)))
+    level = np.empty(n, dtype=np.int8)
+    est_min = np.empty(n)
+    style_flags = np.zeros((n, _STYLE_FLAG_COLUMNS), dtype=bool)
+    interest_index: Dict[Tuple[str, _ActivityText], int] = {}
+    interest_group = np.empty(n, dtype=np.intp)
+    
+    for row, activity in enumerate(activities):
+        for skill in activity.skills:
+            skill_counts[row, skill_index[skill]] += 1.0
+        level[row] = _LEVEL_CODES[activity.level]
+        est_min[row] = activity.estimated_min
+        tags = _normalized_activity(activity).tags
+        style_flags[row] = (
+            not tags.isdisjoint(_VISUAL_TAGS),
+            activity.format in _FREEFORM,
+            activity.type in _AUDITORY_TYPES,
+            activity.type in _LOGICAL_TYPES,
+            not tags.isdisjoint(_LOGICAL_TAGS),
+            not tags.isdisjoint(_KINESTHETIC_TAGS)
+        )
+        key = (activity.type, _normalized_activity(activity))
+        interest_group[row] = interest_index.setdefault(key, len(interest_index))
+    
+    return ActivityMatrix(
+        activities=tuple(activities),
+        ids=tuple(activity.id for activity in activities),
+        skill_index=skill_index,
+        skill_counts=skill_counts,
+        skill_totals=skill_counts.sum(axis=1),
+        level=level,
+        est_min=est_min,
+        style_flags=style_flags,
+        interest_keys=tuple(interest_index),
+        interest_group=interest_group,
+        interest_memo={},
+        score_memo={}
+    )
+
+
+# Bounds on memoized interest vectors / score lists kept per matrix
+_INTEREST_MEMO_MAX = 256
+_SCORE_MEMO_MAX = 512
+
+
+def _interest_scores(matrix: ActivityMatrix, child_text: _ChildText) -> np.ndarray:
+    """Return interest_fit for every matrix row, memoized per child interest set."""
+    scores = matrix.interest_memo.get(child_text)
+    if scores is None:
+        # The fuzzy substring rule runs once per distinct (type, tags), not per row
+        per_key = np.fromiter(
+            (_interest_match(activity_type, text, child_text) for activity_type, text in matrix.interest_keys),
+            dtype=float, count=len(matrix.interest_keys)
+        )
+        scores = per_key[matrix.interest_group]
+        if len(matrix.interest_memo) >= _INTEREST_MEMO_MAX:
+            matrix.interest_memo.clear()
+        matrix.interest_memo[child_text] = scores
+    return scores
+
+
+# The last matrix built, reused while callers keep passing the same
+# Activity objects (load_activities hands out the same cached objects)
+_last_matrix: Optional[ActivityMatrix] = None
+
+
+def _activity_matrix(activities: List[Activity]) -> ActivityMatrix:
+    global _last_matrix
+    matrix = _last_matrix
+    if (matrix is None or len(matrix.activities) != len(activities) or
+            any(a is not b for a, b in zip(matrix.activities, activities))):
+        matrix = _last_matrix = build_activity_matrix(activities)
+    return matrix
+
+
+def score_activity_matrix(
+    matrix: ActivityMatrix,
+    child: ChildProfile,
+    history: List[str],
+    recent_k: int = 2
+) -> np.ndarray:
+    """
+    Score every activity in a matrix for one child with array operations.
+    
+    Args:
+        matrix: Features from build_activity_matrix
+        child: The child profile
+        history: List of recent activity IDs (most recent first)
+        recent_k: Number of recent activities that incur the recency penalty
+        
+    Returns:
+        Array of total scores, one per matrix row
+    """
+    n = len(matrix.ids)
+    if n == 0:
+        return np.zeros(0)
+    
+    # Skill fit: mean of the child's skills (0.5 when unknown) per activity
+    child_skills = np.full(len(matrix.skill_index), 0.5)
+    get = child.baseline_skills.get
+    for skill, col in matrix.skill_index.items():
+        child_skills[col] = get(skill, 0.5)
+    totals = matrix.skill_totals
+    skill = np.divide(matrix.skill_counts @ child_skills, totals,
+                      out=np.full(n, 0.5), where=totals > 0)
+    
+    # Level fit from the same mean skill
+    low = skill < 0.6
+    mid = (skill >= 0.6) & (skill <= 0.8)
+    high = skill > 0.8
+    level = np.where(
+        matrix.level == 0, np.where(low, 1.0, np.where(mid, 0.7, 0.4)),
+        np.where(
+            matrix.level == 1, np.where(mid, 1.0, 0.7),
+            np.where(high, 1.0, np.where(mid, 0.7, 0.4))
+        )
+    )
+    
+    # Time fit: linear decay to 0.5 beyond the attention span
+    span = child.attention_span_min
+    fits = matrix.est_min <= span
+    time = np.where(fits, 1.0, np.clip(0.5 + 0.5 * (span / matrix.est_min), 0.5, 1.0))
+    
+    # Style fit per learning style (see the _style_fit_* handlers)
+    flags = matrix.style_flags
+    style_name = child.learning_style
+    if style_name == "visual":
+        preferred = flags[:, 0] | flags[:, 1]
+    elif style_name == "auditory":
+        preferred = flags[:, 2] | flags[:, 1]
+    elif style_name == "logical":
+        preferred = flags[:, 3] | flags[:, 4]
+    elif style_name == "kinesthetic":
+        preferred = flags[:, 5] | fits
+    else:
+        preferred = np.zeros(n, dtype=bool)
+    style = np.where(preferred, 1.0, 0.5)
+    
+    interest = _interest_scores(matrix, _normalized_child(child))
+    
+    recent = frozenset(history[:recent_k])
+    recency = np.fromiter((i in recent for i in matrix.ids), dtype=float, count=n)
+    
+    return (
+        _W_SKILL * skill +
+        _W_INTEREST * interest +
+        _W_STYLE * style +
+        _W_LEVEL * level +
+        _W_TIME * time -
+        _W_RECENCY * recency
+    )
+
+
+def total_score_batch(
+    activities: List[Activity],
+    child: ChildProfile,
+    history: List[str],
+    recent_k: int = 2
+) -> List[float]:
+    """
+    Calculate total recommendation scores for many activities at once.
+    
+    Equivalent to calling total_score for each activity, but the scoring is
+    done with array operations over an ActivityMatrix, which is reused
+    across calls with the same activity objects. Results are memoized on the
+    matrix by everything the score depends on (the child's skills, interests,
+    style and attention span, the recent IDs and the weights), so repeat
+    rankings of an unchanged child and history cost one dict lookup.
+    
+    Args:
+        activities: The activities to score
+        child: The child profile
+        history: List of recent activity IDs (most recent first)
+        recent_k: Number of recent activities that incur the recency penalty
+        
+    Returns:
+        Scores in the same order as activities
+    """
+    matrix = _activity_matrix(activities)
+    key = (
+        tuple(child.baseline_skills.items()),
+        _normalized_child(child),
+        child.learning_style,
+        child.attention_span_min,
+        tuple(history[:recent_k]),
+        (_W_SKILL, _W_INTEREST, _W_STYLE, _W_LEVEL, _W_TIME, _W_RECENCY)
+    )
+    scores = matrix.score_memo.get(key)
+    if scores is None:
+        scores = tuple(score_activity_matrix(matrix, child, history, recent_k).tolist())
+        if len(matrix.score_memo) >= _SCORE_MEMO_MAX:
+            matrix.score_memo.clear()
+        matrix.score_memo[key] = scores
+    return list(scores)
+
+
 # Export the weights for external tuning
 __all__ = [
     "WEIGHTS",
@@ -300,6 +659,11 @@ __all__ = [
     "time_fit",
     "recency_penalty",
     "total_score",
+    "total_score_batch",
+    "ActivityMatrix",
+    "build_activity_matrix",
+    "score_activity_matrix",
+    "reload_weights",
     "mean",
     "normalize_text"
 ]
@@ -5,12 +5,18 @@ This module provides functions to recommend educational activities to children
 based on their profiles, available activities, and learning history.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from .data_models import Activity, ChildProfile
-from .policy import total_score
+from .policy import total_score_batch
 from .session import SessionLog, recent_activity_ids
 
 
+# Scoring components in WEIGHTS order, as reported by explain_scores
+_COMPONENT_KEYS = ("skill_fit", "interest_fit", "style_fit", "level_fit", "time_fit", "recency_penalty")
+
+
 def recommend_activities(
     child: ChildProfile,
     activities: List[Activity],
@@ -37,7 +43,7 @@ def recommend_activities(
     Returns:
         List of recommended activities sorted by score
     """
-    if not activities:
+    if not activities or k <= 0:
         return []
     
     # Convert history to list if None
@@ -47,22 +53,20 @@ def recommend_activities(
     # Step 1: Pre-filter (no-op for now, future enhancement will add age/grade filtering)
     filtered_activities = activities.copy()
     
-    # Step 2: Score each activity
-    scored_activities = []
-    for activity in filtered_activities:
-        score = total_score(activity, child, history)
-        scored_activities.append((activity, score))
+    # Step 2: Score each activity (recency is judged on the last 2 attempts,
+    # as in explain_recommendation)
+    scores = total_score_batch(filtered_activities, child, recent_activity_ids(history, k=2))
+    scored_activities = list(zip(filtered_activities, scores))
     
-    # Step 3: Sort by score (descending)
-    scored_activities.sort(key=lambda x: x[1], reverse=True)
+    # Step 3: Take the top k by score (descending). nlargest is O(N log k) and
+    # returns exactly what a stable descending sort would put first.
+    by_score = itemgetter(1)
+    top_candidates = heapq.nlargest(k, scored_activities, key=by_score)
     
     # Step 4: Diversity pass - ensure at least 2 distinct activity types
     selected = []
     selected_types = set()
     
-    # Take top k candidates
-    top_candidates = scored_activities[:k]
-    
     for activity, score in top_candidates:
         selected.append((activity, score))
         selected_types.add(activity.type)
@@ -73,37 +77,32 @@ def recommend_activities(
         lowest_scored = min(selected, key=lambda x: x[1])
         lowest_activity, lowest_score = lowest_scored
         
-        # Look for a different type among remaining candidates
-        for activity, score in scored_activities[k:]:
-            if activity.type not in selected_types:
-                # Replace the lowest-scored with this different type
-                selected.remove(lowest_scored)
-                selected.append((activity, score))
-                selected_types.add(activity.type)
-                break
+        # Look for the best-scored candidate of a different type. None of the
+        # top k qualify (their types are all in selected_types), and max()
+        # keeps the earliest of equal scores, as the sorted order did.
+        different = max(
+            (pair for pair in scored_activities if pair[0].type not in selected_types),
+            key=by_score,
+            default=None
+        )
+        if different is not None:
+            activity, score = different
+            # Replace the lowest-scored with this different type
+            selected.remove(lowest_scored)
+            selected.append((activity, score))
+            selected_types.add(activity.type)
     
-    # Step 5: Safety fallback - if we have less than 2 recommendations
-    if len(selected) < 2:
-        # Re-score without recency penalty (temporary relaxation)
-        relaxed_scores = []
-        for activity in filtered_activities:
-            # Create a temporary history without recent activities for this specific activity
-            temp_history = []
-            for session in history:
-                temp_session = SessionLog(
-                    child_id=session.child_id,
-                    attempts=[attempt for attempt in session.attempts if attempt.activity_id != activity.id]
-                )
-                if temp_session.attempts:
-                    temp_history.append(temp_session)
-            
-            # Recalculate score without recency penalty for this activity
-            score = total_score(activity, child, temp_history)
-            relaxed_scores.append((activity, score))
+    # Step 5: Safety fallback - if we have less than 2 recommendations. When
+    # every activity is already selected, re-scoring cannot pick anything else.
+    if len(selected) < 2 and len(selected) < len(filtered_activities):
+        # Re-score without recency penalty (temporary relaxation). Dropping an
+        # activity's own attempts from history always clears its own penalty,
+        # so this is the batch score with no recent IDs; no per-activity
+        # history rebuild is needed.
+        relaxed_scores = list(zip(filtered_activities, total_score_batch(filtered_activities, child, [])))
         
-        # Sort by relaxed scores and take top k
-        relaxed_scores.sort(key=lambda x: x[1], reverse=True)
-        selected = relaxed_scores[:k]
+        # Take top k by relaxed score
+        selected = heapq.nlargest(k, relaxed_scores, key=by_score)
     
     # Step 6: Return activities (cap at 3)
     k = min(k, 3)
@@ -112,13 +111,48 @@ def recommend_activities(
     return recommended_activities
 
 
-def explain_recommendation(
+class Explanation(NamedTuple):
+    """
+    Score breakdown for one activity, as computed by explain_scores.
+    
+    Component scores, weights and weighted scores are tuples in
+    _COMPONENT_KEYS order; as_dict() builds the nested dict returned by
+    explain_recommendation.
+    """
+    activity: Activity
+    child: ChildProfile
+    scores: Tuple[float, ...]
+    weights: Tuple[float, ...]
+    weighted: Tuple[float, ...]
+    total_score: float
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the explanation as a JSON-friendly dict."""
+        activity, child = self.activity, self.child
+        return {
+            "activity_id": activity.id,
+            "activity_title": activity.title,
+            "activity_type": activity.type,
+            "activity_level": activity.level,
+            "component_scores": {
+                key: {"score": score, "weight": weight, "weighted_score": weighted_score}
+                for key, score, weight, weighted_score in zip(_COMPONENT_KEYS, self.scores, self.weights, self.weighted)
+            },
+            "total_score": self.total_score,
+            "child_id": child.id,
+            "child_name": child.name,
+            "child_learning_style": child.learning_style,
+            "child_reading_level": child.reading_level
+        }
+
+
+def explain_scores(
     child: ChildProfile,
     activity: Activity,
     history: Optional[List[SessionLog]] = None
-) -> Dict[str, Any]:
+) -> Explanation:
     """
-    Explain why an activity was recommended by breaking down the scoring components.
+    Break an activity's recommendation score down into its components.
     
     Args:
         child: Child profile
@@ -126,7 +160,7 @@ def explain_recommendation(
         history: Optional session history
         
     Returns:
-        Dictionary with component scores and total score
+        Explanation with the component scores, weights and total score
     """
     if history is None:
         history = []
@@ -142,70 +176,48 @@ def explain_recommendation(
         WEIGHTS
     )
     
-    # Get recent activity IDs for recency penalty
-    recent_ids = recent_activity_ids(history, k=2)
+    # Recent activity IDs for recency penalty, as a set for the membership test
+    recent_ids = frozenset(recent_activity_ids(history, k=2))
     
-    # Calculate each component score
+    # Calculate each component score, in _COMPONENT_KEYS order
     skill_score = skill_fit(activity, child)
-    interest_score = interest_fit(activity, child)
-    style_score = style_fit(activity, child)
-    level_score = level_fit(activity, child)
-    time_score = time_fit(activity, child)
-    recency_penalty_score = recency_penalty(activity.id, recent_ids)
-    
-    # Calculate weighted total
-    total = (
-        WEIGHTS["skill_fit"] * skill_score +
-        WEIGHTS["interest_fit"] * interest_score +
-        WEIGHTS["style_fit"] * style_score +
-        WEIGHTS["level_fit"] * level_score +
-        WEIGHTS["time_fit"] * time_score -
-        WEIGHTS["recency_penalty"] * recency_penalty_score
+    scores = (
+        skill_score,
+        interest_fit(activity, child),
+        style_fit(activity, child),
+        level_fit(activity, child, mean_skill=skill_score),
+        time_fit(activity, child),
+        recency_penalty(activity.id, recent_ids)
     )
     
-    return {
-        "activity_id": activity.id,
-        "activity_title": activity.title,
-        "activity_type": activity.type,
-        "activity_level": activity.level,
-        "component_scores": {
-            "skill_fit": {
-                "score": skill_score,
-                "weight": WEIGHTS["skill_fit"],
-                "weighted_score": WEIGHTS["skill_fit"] * skill_score
-            },
-            "interest_fit": {
-                "score": interest_score,
-                "weight": WEIGHTS["interest_fit"],
-                "weighted_score": WEIGHTS["interest_fit"] * interest_score
-            },
-            "style_fit": {
-                "score": style_score,
-                "weight": WEIGHTS["style_fit"],
-                "weighted_score": WEIGHTS["style_fit"] * style_score
-            },
-            "level_fit": {
-                "score": level_score,
-                "weight": WEIGHTS["level_fit"],
-                "weighted_score": WEIGHTS["level_fit"] * level_score
-            },
-            "time_fit": {
-                "score": time_score,
-                "weight": WEIGHTS["time_fit"],
-                "weighted_score": WEIGHTS["time_fit"] * time_score
-            },
-            "recency_penalty": {
-                "score": recency_penalty_score,
-                "weight": WEIGHTS["recency_penalty"],
-                "weighted_score": WEIGHTS["recency_penalty"] * recency_penalty_score
-            }
-        },
-        "total_score": total,
-        "child_id": child.id,
-        "child_name": child.name,
-        "child_learning_style": child.learning_style,
-        "child_reading_level": child.reading_level
-    }
+    # Each weight is read and each product taken once, then shared by the
+    # total and the breakdown. The total adds the terms in the same order as
+    # total_score, so the two agree exactly.
+    weights = tuple(WEIGHTS[key] for key in _COMPONENT_KEYS)
+    weighted = tuple(w * x for w, x in zip(weights, scores))
+    skill_w, interest_w, style_w, level_w, time_w, recency_w = weighted
+    total = skill_w + interest_w + style_w + level_w + time_w - recency_w
+    
+    return Explanation(activity, child, scores, weights, weighted, total)
+
+
+def explain_recommendation(
+    child: ChildProfile,
+    activity: Activity,
+    history: Optional[List[SessionLog]] = None
+) -> Dict[str, Any]:
+    """
+    Explain why an activity was recommended by breaking down the scoring components.
+    
+    Args:
+        child: Child profile
+        activity: Activity to explain
+        history: Optional session history
+        
+    Returns:
+        Dictionary with component scores and total score
+    """
+    return explain_scores(child, activity, history).as_dict()
 
 
 if __name__ == "__main__":
@@ -243,18 +255,18 @@ if __name__ == "__main__":
         print("=" * 60)
         
         for i, activity in enumerate(recommended, 1):
-            explanation = explain_recommendation(child, activity, history=None)
+            explanation = explain_scores(child, activity, history=None)
             
             print(f"\n{i}. {activity.title}")
             print(f"   Type: {activity.type} | Level: {activity.level}")
             print(f"   Estimated time: {activity.estimated_min} minutes")
             print(f"   Skills: {', '.join(activity.skills)}")
-            print(f"   Total Score: {explanation['total_score']:.3f}")
+            print(f"   Total Score: {explanation.total_score:.3f}")
             
             # Show component scores
             print("   Component Scores:")
-            for component, data in explanation['component_scores'].items():
-                print(f"     {component}: {data['score']:.3f} (weight: {data['weight']:.2f})")
+            for component, score, weight in zip(_COMPONENT_KEYS, explanation.scores, explanation.weights):
+                print(f"     {component}: {score:.3f} (weight: {weight:.2f})")
         
         print(f"\nRecommendation complete!")
         
@@ -1,6 +1,9 @@
 from __future__ import annotations
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple, Literal
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union, Literal
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import json
@@ -8,16 +11,24 @@ import argparse
 
 from .data_models import Activity, ChildProfile
 from .loader import load_activities, load_profiles
-from .session import SessionLog, ActivityAttempt
+from .session import OUTCOMES, SessionLog, fast_history, _AttemptFast, _SessionFast
 from .persist import load_history
 from .recommender import recommend_activities, explain_recommendation
 
+try:
+    import orjson
+except ImportError:  # optional: pip install "ai-buddy[fast]"
+    orjson = None
+
 # -------------------------
 # Data & helpers
 # -------------------------
 
 OutcomeScore = {"success": 1.0, "partial": 0.6, "struggle": 0.2, "skipped": 0.0}
 
+# OutcomeScore indexed by the outcome_code of fast_history attempts
+_OUTCOME_SCORES = tuple(OutcomeScore[o] for o in OUTCOMES)
+
 HOME_TIPS = {
     "spelling": "Play quick word-family games (cat, bat, mat). 5 minutes a day builds confidence.",
     "pattern_recognition": "Look for patterns in nature or blocks at home. Ask: 'What comes next?'",
@@ -59,53 +70,56 @@ class SkillStat:
     total_score: float = 0.0
     avg: float = 0.0
 
-def _collect_attempts_for_child(history: List[SessionLog], child_id: str, start: datetime, end: datetime) -> List[ActivityAttempt]:
-    rows: List[ActivityAttempt] = []
+def _sessions_by_child(history: List[_SessionFast]) -> Dict[str, List[_SessionFast]]:
+    # One pass over the history, so each report only walks its own child's sessions
+    by_child: Dict[str, List[_SessionFast]] = defaultdict(list)
     for sess in history:
-        if sess.child_id != child_id: continue
-        for att in sess.attempts:
-            # Convert naive datetime to timezone-aware if needed
-            timestamp = att.timestamp
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            if start <= timestamp <= end:
-                rows.append(att)
+        by_child[sess.child_id].append(sess)
+    return dict(by_child)
+
+# The aggregation helpers below take fast_history output: timestamps are
+# timezone-aware and each attempt carries outcome_code
+def _collect_attempts(sessions: List[_SessionFast], start: datetime, end: datetime) -> List[_AttemptFast]:
+    rows: List[_AttemptFast] = []
+    for sess in sessions:
+        # Timestamps are already timezone-aware (see fast_history)
+        rows.extend(att for att in sess.attempts if start <= att.timestamp <= end)
     return rows
 
-def _fallback_if_empty(period_attempts: List[ActivityAttempt], history: List[SessionLog], child_id: str) -> Tuple[List[ActivityAttempt], bool]:
+def _fallback_if_empty(period_attempts: List[_AttemptFast], sessions: List[_SessionFast]) -> Tuple[List[_AttemptFast], bool]:
     if period_attempts:
         return period_attempts, False
     # fallback to lifetime
-    rows: List[ActivityAttempt] = []
-    for sess in history:
-        if sess.child_id != child_id: continue
+    rows: List[_AttemptFast] = []
+    for sess in sessions:
         rows.extend(sess.attempts)
     return rows, True
 
-def _skill_and_type_metrics(attempts: List[ActivityAttempt], idx: Dict[str, Activity]) -> Tuple[Dict[str, SkillStat], Dict[str, SkillStat]]:
-    skills: Dict[str, SkillStat] = {}
-    types: Dict[str, SkillStat] = {}
+def _skill_and_type_metrics(attempts: List[_AttemptFast], idx: Dict[str, Activity]) -> Tuple[Dict[str, SkillStat], Dict[str, SkillStat]]:
+    skills: Dict[str, SkillStat] = defaultdict(SkillStat)
+    types: Dict[str, SkillStat] = defaultdict(SkillStat)
+    outcome_scores = _OUTCOME_SCORES
+    idx_get = idx.get
     for att in attempts:
-        score = OutcomeScore.get(att.outcome, 0.0)
-        aid = att.activity_id
-        act = idx.get(aid)
-        if not act: continue
+        act = idx_get(att.activity_id)
+        if act is None: continue
+        score = outcome_scores[att.outcome_code]
         # skills
         for s in act.skills:
-            st = skills.setdefault(s, SkillStat())
+            st = skills[s]
             st.attempts += 1
             st.total_score += score
         # types
-        tt = types.setdefault(act.type, SkillStat())
+        tt = types[act.type]
         tt.attempts += 1
         tt.total_score += score
-    # finalize avg
+    # finalize avg once per key (cheaper than re-dividing on every update)
     for d in (skills, types):
         for st in d.values():
-            st.avg = (st.total_score / st.attempts) if st.attempts else 0.0
-    return skills, types
+            st.avg = st.total_score / st.attempts
+    return dict(skills), dict(types)
 
-def _time_fit_share(attempts: List[ActivityAttempt], idx: Dict[str, Activity], attention_span_min: int) -> float:
+def _time_fit_share(attempts: List[_AttemptFast], idx: Dict[str, Activity], attention_span_min: int) -> float:
     if not attempts: return 0.0
     ok = 0
     for att in attempts:
@@ -131,15 +145,19 @@ def _classify(skills: Dict[str, SkillStat]) -> Tuple[List[str], List[str]]:
 # Report generation
 # -------------------------
 
-def _interests_engaged(child: ChildProfile, attempts: List[ActivityAttempt], idx: Dict[str, Activity]) -> List[str]:
+@functools.lru_cache(maxsize=1024)
+def _activity_tokens(activity_type: str, tags: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset([activity_type.lower(), *(t.lower() for t in tags)])
+
+def _interests_engaged(child: ChildProfile, attempts: List[_AttemptFast], idx: Dict[str, Activity]) -> List[str]:
     hits = set()
-    child_int = set(x.lower() for x in child.interests)
-    for att in attempts:
-        act = idx.get(att.activity_id)
+    child_int = frozenset(x.lower() for x in child.interests)
+    # Hits are a union, so each distinct activity only needs checking once;
+    # its lowercased tokens are cached across reports
+    for aid in dict.fromkeys(att.activity_id for att in attempts):
+        act = idx.get(aid)
         if not act: continue
-        tokens = set([act.type.lower(), *[t.lower() for t in act.tags]])
-        if child_int & tokens:
-            hits.update(child_int & tokens)
+        hits |= child_int & _activity_tokens(act.type, tuple(act.tags))
     return sorted(hits)[:3]
 
 def _tips_for_focus(skills: List[str]) -> List[str]:
@@ -178,11 +196,25 @@ def _json_metrics(child_id: str, period_label: str, lifetime_fallback: bool, ski
         "recommended": [a.id for a in picks]
     }
 
-def generate_parent_report(child: ChildProfile, activities: List[Activity], history: List[SessionLog], period: str = "7d", out_dir: str = "reports", fmt: Literal["md","json","both"]="md") -> List[Path]:
+def _dump_json(js: Dict[str, Any]) -> bytes:
+    # orjson's C encoder when available. Both encoders leave non-ASCII text
+    # unescaped, so the bytes do not depend on whether orjson is installed.
+    if orjson is not None:
+        return orjson.dumps(js, option=orjson.OPT_INDENT_2)
+    return json.dumps(js, indent=2, ensure_ascii=False).encode("utf-8")
+
+def generate_parent_report(child: ChildProfile, activities: List[Activity], history: List[SessionLog], period: str = "7d", out_dir: str = "reports", fmt: Literal["md","json","both"]="md", idx: Optional[Dict[str, Activity]] = None, sessions: Optional[List[Union[SessionLog, _SessionFast]]] = None) -> List[Path]:
     start, end = _period_range(period)
-    idx = _index_activities(activities)
-    attempts = _collect_attempts_for_child(history, child.id, start, end)
-    attempts, lifetime = _fallback_if_empty(attempts, history, child.id)
+    # Callers writing many reports pass the activity index and this child's
+    # sessions in, each built once for the whole run. Sessions may be
+    # SessionLogs or already converted by fast_history (then used as-is).
+    if idx is None:
+        idx = _index_activities(activities)
+    if sessions is None:
+        sessions = [s for s in history if s.child_id == child.id]
+    sessions = fast_history(sessions)
+    attempts = _collect_attempts(sessions, start, end)
+    attempts, lifetime = _fallback_if_empty(attempts, sessions)
 
     skill_stats, type_stats = _skill_and_type_metrics(attempts, idx)
     interests = _interests_engaged(child, attempts, idx)
@@ -206,7 +238,7 @@ def generate_parent_report(child: ChildProfile, activities: List[Activity], hist
         paths.append(p)
     if fmt in ("json","both"):
         p = out / f"{child.id}_{stamp}.json"
-        p.write_text(json.dumps(js, indent=2), encoding="utf-8")
+        p.write_bytes(_dump_json(js))
         paths.append(p)
     return paths
 
@@ -214,6 +246,38 @@ def generate_parent_report(child: ChildProfile, activities: List[Activity], hist
 # CLI
 # -------------------------
 
+# Below this many children the pool start-up costs more than it saves
+POOL_MIN_CHILDREN = 8
+
+# Shared with pool workers once via the initializer instead of per task
+_worker_args: Tuple[Any, ...] = ()
+
+def _init_worker(activities: List[Activity], history: List[_SessionFast], period: str, out_dir: str, fmt: str) -> None:
+    global _worker_args
+    _worker_args = (activities, history, period, out_dir, fmt, _index_activities(activities), _sessions_by_child(history))
+
+def _gen_one(child: ChildProfile) -> List[Path]:
+    activities, history, period, out_dir, fmt, idx, by_child = _worker_args
+    return generate_parent_report(child, activities, history, period, out_dir, fmt, idx=idx, sessions=by_child.get(child.id, []))
+
+def _generate_reports(targets: List[ChildProfile], activities: List[Activity], history: List[SessionLog], period: str, out_dir: str, fmt: str) -> List[Path]:
+    """Generate one report per child, across processes for large batches; paths keep target order."""
+    # Every report rescans the whole history; read it as plain tuples, with
+    # timestamps normalized to UTC once here instead of per attempt per scan
+    fast = fast_history(history)
+    if len(targets) < POOL_MIN_CHILDREN:
+        # In-process: keep the shared lookups local rather than in _worker_args
+        idx, by_child = _index_activities(activities), _sessions_by_child(fast)
+        results = [
+            generate_parent_report(c, activities, fast, period, out_dir, fmt, idx=idx, sessions=by_child.get(c.id, []))
+            for c in targets
+        ]
+    else:
+        init_args = (activities, fast, period, out_dir, fmt)
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=init_args) as ex:
+            results = list(ex.map(_gen_one, targets, chunksize=4))
+    return [p for paths in results for p in paths]
+
 def main():
     parser = argparse.ArgumentParser(description="Generate parent reports")
     g = parser.add_mutually_exclusive_group(required=True)
@@ -228,9 +292,8 @@ def main():
     if not targets:
         raise SystemExit("No matching child")
 
-    written: List[Path] = []
-    for child in targets:
-        written.extend(generate_parent_report(child, activities, history, args.period, "reports", args.format))
+    # Reports are independent per child
+    written = _generate_reports(targets, activities, history, args.period, "reports", args.format)
 
     print("Wrote:")
     for p in written:
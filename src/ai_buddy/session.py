@@ -5,8 +5,9 @@ This module provides data models and functions for tracking child activity
 attempts and managing session logs.
 """
 
-from datetime import datetime
-from typing import List, Dict, Any, Literal
+import heapq
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Literal, NamedTuple, Tuple, Union
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -51,12 +52,79 @@ class SessionLog(BaseModel):
     )
 
 
+def _utc_timestamp(attempt: ActivityAttempt) -> datetime:
+    # History files mix naive and aware timestamps; treat naive ones as UTC
+    # (as report.py does) so they can be ordered together
+    timestamp = attempt.timestamp
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+# ActivityAttempt.outcome values in code order; fast_history stores each
+# attempt's outcome_code as an index into this tuple
+OUTCOMES = ("success", "partial", "struggle", "skipped")
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(OUTCOMES)}
+
+
+class _AttemptFast(NamedTuple):
+    """Read-only tuple view of an ActivityAttempt for aggregation loops."""
+    activity_id: str
+    timestamp: datetime
+    outcome: str
+    outcome_code: int
+
+
+class _SessionFast(NamedTuple):
+    """Read-only tuple view of a SessionLog holding _AttemptFast attempts."""
+    child_id: str
+    attempts: Tuple[_AttemptFast, ...]
+
+
+def fast_history(history: List[Union[SessionLog, _SessionFast]]) -> List[_SessionFast]:
+    """
+    Convert session logs to plain read-only tuples for repeated scans.
+    
+    Field reads on tuples are several times cheaper than on pydantic models,
+    so callers that walk the same history many times (e.g. reports for every
+    child) convert once up front. The result has the same child_id/attempts
+    and activity_id/timestamp/outcome attributes, so it can be passed to the
+    read-only history helpers (recent_activity_ids, recommend_activities);
+    validation and persistence keep using the pydantic models.
+    
+    Timestamps are normalized here, once: naive ones are taken as UTC, so
+    every timestamp in the result is timezone-aware and can be compared
+    directly against aware period bounds. Each attempt also carries an
+    outcome_code, its outcome's index in OUTCOMES, for table lookups.
+    
+    Sessions that are already converted are passed through as they are, so
+    functions can call this on input that may or may not be converted.
+    
+    Args:
+        history: List of session logs, converted or not
+        
+    Returns:
+        One _SessionFast per session, in the same order
+    """
+    codes = _OUTCOME_CODES
+    return [
+        session if isinstance(session, _SessionFast) else _SessionFast(
+            session.child_id,
+            tuple(
+                _AttemptFast(a.activity_id, _utc_timestamp(a), a.outcome, codes[a.outcome])
+                for a in session.attempts
+            )
+        )
+        for session in history
+    ]
+
+
 def recent_activity_ids(history: List[SessionLog], k: int) -> List[str]:
     """
     Return activity_ids from most recent k attempts across sessions.
     
-    Flattens all attempts from all sessions, sorts by timestamp (newest first),
-    and returns the activity_ids from the most recent k attempts.
+    Considers the attempts of all sessions by timestamp (newest first) and
+    returns the activity_ids from the most recent k attempts.
     
     Args:
         history: List of session logs containing activity attempts
@@ -68,18 +136,13 @@ def recent_activity_ids(history: List[SessionLog], k: int) -> List[str]:
     if k <= 0:
         return []
     
-    # Flatten all attempts from all sessions
-    all_attempts = []
-    for session in history:
-        all_attempts.extend(session.attempts)
-    
-    # Sort by timestamp (newest first)
-    sorted_attempts = sorted(all_attempts, key=lambda x: x.timestamp, reverse=True)
-    
-    # Extract activity_ids from the most recent k attempts
-    recent_ids = [attempt.activity_id for attempt in sorted_attempts[:k]]
-    
-    return recent_ids
+    # Most recent k across all sessions: O(T log k) heap selection over a
+    # generator instead of flattening and sorting every attempt. Ties keep
+    # their history order, as a stable newest-first sort would.
+    recent = heapq.nlargest(
+        k, (attempt for session in history for attempt in session.attempts), key=_utc_timestamp
+    )
+    return [attempt.activity_id for attempt in recent]
 
 
 def append_attempt(history: List[SessionLog], child_id: str, attempt: ActivityAttempt) -> List[SessionLog]:
@@ -125,6 +188,8 @@ def append_attempt(history: List[SessionLog], child_id: str, attempt: ActivityAt
 __all__ = [
     "ActivityAttempt",
     "SessionLog", 
+    "OUTCOMES",
+    "fast_history",
     "recent_activity_ids",
     "append_attempt"
 ]
@@ -6,10 +6,57 @@ This module provides functions to simulate child responses for testing purposes.
 
 from __future__ import annotations
 import random
-from typing import Union
+import zlib
+from typing import List, Optional, Sequence, Union
+import numpy as np
 from .data_models import Activity, ChildProfile
 
 
+# Correct answers used when a Q&A rubric has no string answers to pick from
+_FALLBACK_ANSWERS = {
+    "math": "42",
+    "spelling": "correct",
+    "vocab": "definition",
+    "logic": "true",
+    "reading": "comprehension",
+    "storytelling": "narrative",
+    "creativity": "creative"
+}
+# Activity.type is a Literal field, so validated types are the Literal's own
+# string objects; the bound lookup hashes and compares them by identity
+_fallback_answer = _FALLBACK_ANSWERS.get
+
+
+def _mean_skill(child: ChildProfile, activity: Activity) -> float:
+    """Mean of the child's skills for the activity (0.5 for unknown skills or none)."""
+    if not activity.skills:
+        return 0.5
+    skill_values = [child.baseline_skills.get(skill, 0.5) for skill in activity.skills]
+    return sum(skill_values) / len(skill_values)
+
+
+def _freeform_sentences(child: ChildProfile, activity: Activity, mean_skill: float) -> List[str]:
+    """Base sentences of a freeform answer, before any keywords are added."""
+    # Calculate base sentence count based on attention span and mean skill
+    base_sentences = max(2, child.attention_span_min // 10)  # 1 sentence per 10 minutes
+    
+    # Add skill bonus (0-3 extra sentences)
+    skill_bonus = int(mean_skill * 3)
+    total_sentences = base_sentences + skill_bonus
+    
+    # Ensure minimum sentences if specified in rubric
+    if activity.rubric.get("min_sentences"):
+        total_sentences = max(total_sentences, activity.rubric["min_sentences"])
+    
+    if activity.type == "storytelling":
+        template = "This is sentence {} of my story."
+    elif activity.type == "reading":
+        template = "I read and understood sentence {}."
+    else:
+        template = "This is my response sentence {}."
+    return [template.format(i + 1) for i in range(total_sentences)]
+
+
 def answer(child: ChildProfile, activity: Activity) -> str:
     """
     Returns a deterministic pseudo-random answer depending on child skill level and activity type.
@@ -21,87 +68,108 @@ def answer(child: ChildProfile, activity: Activity) -> str:
     Returns:
         Simulated answer (string, float, or int)
     """
-    # Seed random generator using child.id + activity.id for repeatability
-    seed_value = hash(child.id + activity.id) % (2**32)
-    random.seed(seed_value)
+    # Seed a local generator from child.id + activity.id for repeatability.
+    # crc32 is stable across processes (str hash() is salted per process), and
+    # a local Random leaves the global random state alone.
+    seed_value = zlib.crc32((child.id + activity.id).encode("utf-8"))
+    rng = random.Random(seed_value)
+    
+    mean_skill = _mean_skill(child, activity)
     
     if activity.format == "qna":
-        # Calculate mean skill for activity skills
-        mean_skill = 0.5  # default
-        if activity.skills:
-            skill_values = [child.baseline_skills.get(skill, 0.5) for skill in activity.skills]
-            mean_skill = sum(skill_values) / len(skill_values)
-        
         # Determine success probability based on skill level
-        if mean_skill > 0.7:
-            success_chance = 0.8  # 80% chance for high skill
-        else:
-            success_chance = 0.4  # 40% chance for lower skill
+        success_chance = 0.8 if mean_skill > 0.7 else 0.4
         
         # Generate answer based on success probability
-        if random.random() < success_chance:
+        if rng.random() < success_chance:
             # Return correct answer
             if activity.rubric.get("answers"):
                 # Pick from available answers if they exist
                 available_answers = [ans for ans in activity.rubric["answers"] if isinstance(ans, str)]
                 if available_answers:
-                    return random.choice(available_answers)
+                    return rng.choice(available_answers)
             
             # Fallback correct answers based on activity type
-            fallbacks = {
-                "math": "42",
-                "spelling": "correct",
-                "vocab": "definition",
-                "logic": "true",
-                "reading": "comprehension",
-                "storytelling": "narrative",
-                "creativity": "creative"
-            }
-            return fallbacks.get(activity.type, "answer")
+            return _fallback_answer(activity.type, "answer")
         else:
             # Return incorrect answer
             return "wrong answer"
     
     else:  # freeform
-        # Calculate base sentence count based on attention span and mean skill
-        base_sentences = max(2, child.attention_span_min // 10)  # 1 sentence per 10 minutes
-        
-        # Adjust based on mean skill
-        mean_skill = 0.5
-        if activity.skills:
-            skill_values = [child.baseline_skills.get(skill, 0.5) for skill in activity.skills]
-            mean_skill = sum(skill_values) / len(skill_values)
-        
-        # Add skill bonus (0-3 extra sentences)
-        skill_bonus = int(mean_skill * 3)
-        total_sentences = base_sentences + skill_bonus
-        
-        # Ensure minimum sentences if specified in rubric
-        if activity.rubric.get("min_sentences"):
-            total_sentences = max(total_sentences, activity.rubric["min_sentences"])
-        
-        # Generate sentences
-        sentences = []
-        for i in range(total_sentences):
-            if activity.type == "storytelling":
-                sentences.append(f"This is sentence {i+1} of my story.")
-            elif activity.type == "reading":
-                sentences.append(f"I read and understood sentence {i+1}.")
-            else:
-                sentences.append(f"This is my response sentence {i+1}.")
+        sentences = _freeform_sentences(child, activity, mean_skill)
         
         # Occasionally include activity skills as keywords
-        if activity.skills and random.random() < 0.7:
-            skill_keyword = random.choice(activity.skills)
+        if activity.skills and rng.random() < 0.7:
+            skill_keyword = rng.choice(activity.skills)
             sentences.append(f"I think about {skill_keyword}.")
         
         # Occasionally include rubric keywords if available
-        if activity.rubric.get("keywords") and random.random() < 0.5:
-            keyword = random.choice(activity.rubric["keywords"])
+        if activity.rubric.get("keywords") and rng.random() < 0.5:
+            keyword = rng.choice(activity.rubric["keywords"])
             sentences.append(f"I mention {keyword} in my response.")
         
         return " ".join(sentences)
 
 
-# Export the function
-__all__ = ["answer"]
+def answer_batch(child: ChildProfile, activities: Sequence[Activity], seed: Optional[int] = None) -> List[str]:
+    """
+    Simulate one child's answers to many activities at once.
+    
+    Mean skills and all random draws are computed as arrays from a single
+    NumPy generator, so the batch is repeatable for a given seed. The answers
+    follow the same rules as answer() but are not the same draws: answer()
+    seeds per child/activity pair.
+    
+    Args:
+        child: The child profile
+        activities: Activities to answer
+        seed: Seed for the batch generator (default: derived from child.id)
+        
+    Returns:
+        One simulated answer per activity, in the same order
+    """
+    n = len(activities)
+    if n == 0:
+        return []
+    if seed is None:
+        seed = zlib.crc32(child.id.encode("utf-8"))
+    rng = np.random.default_rng(seed)
+    
+    # Mean skill per activity: sum each activity's run of skill values
+    get = child.baseline_skills.get
+    counts = np.fromiter((len(a.skills) for a in activities), dtype=np.intp, count=n)
+    values = np.fromiter((get(s, 0.5) for a in activities for s in a.skills), dtype=np.float64, count=int(counts.sum()))
+    sums = np.bincount(np.repeat(np.arange(n), counts), weights=values, minlength=n)
+    mean_skills = np.divide(sums, counts, out=np.full(n, 0.5), where=counts > 0)
+    
+    # Columns: Q&A success, answer pick, skill keyword coin and pick, rubric keyword coin and pick
+    draws = rng.random((n, 6))
+    success = draws[:, 0] < np.where(mean_skills > 0.7, 0.8, 0.4)
+    with_skill = draws[:, 2] < 0.7
+    with_keyword = draws[:, 4] < 0.5
+    
+    answers: List[str] = []
+    for i, activity in enumerate(activities):
+        rubric = activity.rubric
+        if activity.format == "qna":
+            if not success[i]:
+                answers.append("wrong answer")
+                continue
+            available_answers = [ans for ans in rubric.get("answers") or () if isinstance(ans, str)]
+            if available_answers:
+                answers.append(available_answers[int(draws[i, 1] * len(available_answers))])
+            else:
+                answers.append(_fallback_answer(activity.type, "answer"))
+        else:  # freeform
+            sentences = _freeform_sentences(child, activity, float(mean_skills[i]))
+            if activity.skills and with_skill[i]:
+                sentences.append(f"I think about {activity.skills[int(draws[i, 3] * len(activity.skills))]}.")
+            keywords = rubric.get("keywords")
+            if keywords and with_keyword[i]:
+                sentences.append(f"I mention {keywords[int(draws[i, 5] * len(keywords))]} in my response.")
+            answers.append(" ".join(sentences))
+    return answers
+
+
+# Export the functions
+__all__ = ["answer", "answer_batch"]
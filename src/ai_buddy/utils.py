@@ -4,28 +4,97 @@ Utility functions for AI Buddy.
 This module contains helper functions and utilities used across the project.
 """
 
+import atexit
+import functools
 import hashlib
-import json
-from typing import Any, Dict, List, Optional, Union
+import os
+import stat
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 from pathlib import Path
-import logging
 
-from .data_models import DataRecord
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+if TYPE_CHECKING:
+    import logging
+    import logging.handlers
 
-def generate_id(content: str, prefix: str = "record") -> str:
+try:
+    import ormsgpack
+except ImportError:  # optional: pip install "ai-buddy[msgpack]"
+    ormsgpack = None
+
+
+# Records are any pydantic model (e.g. Activity, ChildProfile)
+DataRecord = BaseModel
+
+
+# Content up to this many characters has its ID memoized; longer content is
+# hashed every time so the cache cannot pin large strings in memory
+_ID_CACHE_MAX_LEN = 1024
+
+
+def _hash_id(content: Union[str, bytes, bytearray, memoryview], prefix: str) -> str:
+    # SHA-256 runs on the CPU's SHA extensions through OpenSSL where present,
+    # several times faster than MD5 on large content. Bytes-like content is
+    # hashed as-is, without an encode copy.
+    buf = content.encode() if isinstance(content, str) else content
+    content_hash = hashlib.sha256(buf).hexdigest()[:8]
+    return f"{prefix}_{content_hash}"
+
+
+_cached_hash_id = functools.lru_cache(maxsize=8192)(_hash_id)
+
+
+def generate_id(content: Union[str, bytes, bytearray, memoryview], prefix: str = "record") -> str:
     """
     Generate a unique ID based on content.
     
+    IDs for short content are memoized per process, so repeated calls (e.g.
+    while deduplicating) skip the encode and hash. Bytes-like content gives
+    the same ID as the str it is the UTF-8 encoding of.
+    
     Args:
-        content: Content to hash
+        content: Content to hash, as str or UTF-8 bytes
         prefix: Prefix for the generated ID
         
     Returns:
         Unique ID string
     """
-    content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
-    return f"{prefix}_{content_hash}"
+    # bytearray and memoryview are mutable or unhashable, so never cached
+    if type(content) in (str, bytes) and len(content) <= _ID_CACHE_MAX_LEN:
+        return _cached_hash_id(content, prefix)
+    return _hash_id(content, prefix)
+
+
+def generate_ids(contents: List[str], prefix: str = "record") -> List[str]:
+    """
+    Generate IDs for many contents at once.
+    
+    Gives the same IDs as calling generate_id on each item, in one tight loop
+    with no per-item call or cache lookup; intended for large batches of
+    mostly distinct content, where memoization does not pay off.
+    
+    Args:
+        contents: Contents to hash
+        prefix: Prefix for the generated IDs
+        
+    Returns:
+        One ID per content, in order
+    """
+    sha256 = hashlib.sha256
+    head = f"{prefix}_"
+    return [head + sha256(content.encode()).hexdigest()[:8] for content in contents]
+
+
+def _check_data_file(path: Union[str, Path]) -> None:
+    # One stat call answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise ValueError(f"Path does not exist: {path}")
+    
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Path is not a file: {path}")
 
 
 def validate_data_path(path: Union[str, Path]) -> Path:
@@ -41,75 +110,293 @@ def validate_data_path(path: Union[str, Path]) -> Path:
     Raises:
         ValueError: If path is invalid
     """
-    path_obj = Path(path)
-    
-    if not path_obj.exists():
-        raise ValueError(f"Path does not exist: {path}")
-    
-    if not path_obj.is_file():
-        raise ValueError(f"Path is not a file: {path}")
+    _check_data_file(path)
+    return Path(path)
+
+
+def validate_data_path_str(path: str) -> str:
+    """
+    Validate a data file path without building a Path object.
     
-    return path_obj
+    Args:
+        path: Path to validate
+        
+    Returns:
+        The path, unchanged
+        
+    Raises:
+        ValueError: If path is invalid
+    """
+    _check_data_file(path)
+    return path
+
 
+# Serializes any list of models straight to JSON in pydantic-core: Any
+# dispatches on each record's own type, so every field is kept
+_RECORDS_DUMPER = TypeAdapter(List[Any])
 
-def save_records_to_json(records: List[DataRecord], file_path: Union[str, Path]) -> None:
+
+# Records per encoded chunk when streaming a large list to disk
+_SAVE_CHUNK = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _records_adapter(model: Type[DataRecord]) -> TypeAdapter:
+    # One validator per record model, built on first use
+    return TypeAdapter(List[model])
+
+
+def save_records_to_json(records: List[DataRecord], file_path: Union[str, Path], pretty: bool = False) -> None:
     """
     Save data records to JSON file.
     
-    TODO: Implement proper JSON serialization with error handling.
+    The file is compact JSON unless pretty is set; either form is plain JSON
+    that load_records_from_json (or any JSON parser) reads back.
     
     Args:
         records: List of data records to save
         file_path: Output file path
+        pretty: Indent the output by 2 spaces for reading by eye, at roughly
+            twice the file size
     """
-    # TODO: Implement JSON serialization
-    data = [record.model_dump() for record in records]
+    indent = 2 if pretty else None
+    
+    # Model -> JSON in pydantic-core, no intermediate dicts
+    if len(records) <= _SAVE_CHUNK:
+        Path(file_path).write_bytes(_RECORDS_DUMPER.dump_json(records, indent=indent))
+        return
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Large lists are encoded a chunk at a time so only one chunk's JSON is
+    # in memory. Each chunk encodes as open + items + close; the items are
+    # spliced into one array, giving the same bytes as a single dump.
+    open_, sep, close = (b"[\n", b",\n", b"\n]") if pretty else (b"[", b",", b"]")
+    trim = len(open_)
+    with open(file_path, 'wb') as f:
+        f.write(open_)
+        for start in range(0, len(records), _SAVE_CHUNK):
+            if start:
+                f.write(sep)
+            f.write(_RECORDS_DUMPER.dump_json(records[start:start + _SAVE_CHUNK], indent=indent)[trim:-trim])
+        f.write(close)
 
 
-def load_records_from_json(file_path: Union[str, Path]) -> List[DataRecord]:
+def load_records_from_json(file_path: Union[str, Path], model: Type[DataRecord]) -> List[DataRecord]:
     """
     Load data records from JSON file.
     
-    TODO: Implement proper JSON deserialization with validation.
+    Args:
+        file_path: Input file path
+        model: Record model to validate each item as (e.g. Activity)
+        
+    Returns:
+        List of data records
+        
+    Raises:
+        ValueError: If the JSON data is malformed or doesn't match the model
+    """
+    try:
+        # Parse and validate in one pass into model instances
+        return _records_adapter(model).validate_json(Path(file_path).read_bytes())
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(f"Invalid JSON in {file_path}: {e}")
+        raise ValueError(f"Failed to load records from {file_path}: {e}")
+
+
+# A columnar file is one JSON object mapping each field name to its values
+_COLUMNS_ADAPTER = TypeAdapter(Dict[str, List[Any]])
+
+
+def save_records_to_json_columnar(records: List[DataRecord], file_path: Union[str, Path]) -> None:
+    """
+    Save data records to a JSON file as one list per field.
+    
+    The file is {"field": [value, ...], ...} rather than a list of objects,
+    so each field name is written once and each column can be read straight
+    into NumPy or pandas (e.g. pandas.DataFrame(json.load(f))).
+    
+    Args:
+        records: List of data records to save, all of the same model
+        file_path: Output file path
+        
+    Raises:
+        ValueError: If the records are not all of the same model
+    """
+    if records:
+        model = type(records[0])
+        if any(type(record) is not model for record in records):
+            raise ValueError("Columnar records must all be of the same model")
+    
+    # All records dump in one pydantic-core call, then transpose to columns
+    rows = _RECORDS_DUMPER.dump_python(records, mode="json")
+    columns = {name: [row[name] for row in rows] for name in rows[0]} if rows else {}
+    Path(file_path).write_bytes(_COLUMNS_ADAPTER.dump_json(columns))
+
+
+def load_records_from_json_columnar(file_path: Union[str, Path], model: Type[DataRecord]) -> List[DataRecord]:
+    """
+    Load data records from a JSON file written by save_records_to_json_columnar.
     
     Args:
         file_path: Input file path
+        model: Record model to validate each row as (e.g. Activity)
         
     Returns:
         List of data records
+        
+    Raises:
+        ValueError: If the JSON data is malformed or doesn't match the model
     """
-    # TODO: Implement JSON deserialization with validation
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    try:
+        columns = _COLUMNS_ADAPTER.validate_json(Path(file_path).read_bytes())
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError(f"Failed to load records from {file_path}: columns have different lengths")
+        names = list(columns)
+        rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+        return _records_adapter(model).validate_python(rows)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(f"Invalid JSON in {file_path}: {e}")
+        raise ValueError(f"Failed to load records from {file_path}: {e}")
+
+
+def _require_ormsgpack() -> None:
+    if ormsgpack is None:
+        raise ImportError('MessagePack records need ormsgpack: pip install "ai-buddy[msgpack]"')
+
+
+def save_records_to_msgpack(records: List[DataRecord], file_path: Union[str, Path]) -> None:
+    """
+    Save data records to a MessagePack file.
     
-    records = []
-    # TODO: Validate and convert data to DataRecord objects
-    # for item in data:
-    #     records.append(DataRecord(**item))
+    A compact binary alternative to save_records_to_json for internal
+    persistence; the file is typically a third to a half smaller.
     
-    return records
+    Args:
+        records: List of data records to save
+        file_path: Output file path
+        
+    Raises:
+        ImportError: If ormsgpack is not installed
+    """
+    _require_ormsgpack()
+    # JSON-mode dump keeps datetimes etc. as strings, which validate back
+    Path(file_path).write_bytes(ormsgpack.packb(_RECORDS_DUMPER.dump_python(records, mode="json")))
 
 
-def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
+def load_records_from_msgpack(file_path: Union[str, Path], model: Type[DataRecord]) -> List[DataRecord]:
+    """
+    Load data records from a MessagePack file.
+    
+    Args:
+        file_path: Input file path
+        model: Record model to validate each item as (e.g. Activity)
+        
+    Returns:
+        List of data records
+        
+    Raises:
+        ImportError: If ormsgpack is not installed
+        ValueError: If the data is malformed or doesn't match the model
+    """
+    _require_ormsgpack()
+    try:
+        data = ormsgpack.unpackb(Path(file_path).read_bytes())
+    except ormsgpack.MsgpackDecodeError as e:
+        raise ValueError(f"Invalid MessagePack in {file_path}: {e}")
+    try:
+        return _records_adapter(model).validate_python(data)
+    except ValidationError as e:
+        raise ValueError(f"Failed to load records from {file_path}: {e}")
+
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+@functools.lru_cache(maxsize=None)
+def _epoch_formatter_class() -> "Type[logging.Formatter]":
+    import logging
+    
+    class _EpochFormatter(logging.Formatter):
+        """Formatter stamping asctime as epoch seconds, skipping strftime per record."""
+        
+        def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+            return f"{record.created:.3f}"
+    
+    return _EpochFormatter
+
+
+# Background thread writing queued log records; replaced on each setup_logging call
+_log_listener: "Optional[logging.handlers.QueueListener]" = None
+
+
+def _stop_log_listener() -> None:
+    global _log_listener
+    if _log_listener is not None:
+        # stop() writes out whatever is still queued before the handlers close
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+def setup_logging(level: str = "INFO", log_file: Optional[str] = None, fast: bool = False) -> None:
     """
     Setup logging configuration.
     
+    Log calls only put the record on a queue; a background listener thread
+    owns the console and file handlers, so callers never block on I/O.
+    Queued records are flushed at interpreter exit. Each call replaces the
+    root logger's handlers, including those of an earlier call.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
+        fast: Cheaper per-record formatting for high log volumes: timestamps
+            are epoch seconds (e.g. 1718000000.123) instead of local time, and
+            thread/process details are no longer collected for any logger in
+            the process until setup_logging is called again with fast=False
     """
+    # Imported here so callers that never configure logging don't load it
+    import logging
+    import logging.handlers
+    import queue
+    
+    global _log_listener
     log_level = getattr(logging, level.upper(), logging.INFO)
     
+    handlers: List[logging.Handler] = [
+        logging.StreamHandler(),
+        *([logging.FileHandler(log_file)] if log_file else [])
+    ]
+    formatter = _epoch_formatter_class()(_LOG_FORMAT) if fast else logging.Formatter(_LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    # In fast mode records skip the thread/process lookups the format never
+    # uses. These flags are process-wide, so a non-fast call turns them back on
+    logging.logThreads = not fast
+    logging.logProcesses = not fast
+    logging.logMultiprocessing = not fast
+    
+    _stop_log_listener()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    
+    # The queue handler only merges args (and any traceback) into the
+    # message; the listener's handlers apply the real format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    # force: replace the previous call's queue handler, whose queue is no
+    # longer read
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            *([logging.FileHandler(log_file)] if log_file else [])
-        ]
+        handlers=[queue_handler],
+        force=True
     )
 
 
@@ -123,20 +410,51 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
     Returns:
         Dictionary with file information
     """
-    path = Path(file_path)
-    
-    if not path.exists():
+    # One stat call answers existence, size and mtime together
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         return {"error": "File does not exist"}
     
+    path = Path(file_path)
     return {
         "name": path.name,
-        "size": path.stat().st_size,
-        "modified": path.stat().st_mtime,
+        "size": st.st_size,
+        "modified": st.st_mtime,
         "extension": path.suffix,
         "exists": True
     }
 
 
+def get_file_info_from_entry(entry: os.DirEntry) -> Dict[str, Any]:
+    """
+    Get information about a file from a directory entry.
+    
+    Meant for walking a directory with os.scandir(), which lists a whole
+    directory at once; the entry's stat result is cached after the first
+    call (and on Windows comes with the listing), so this adds at most one
+    stat per file. Returns the same fields as get_file_info.
+    
+    Args:
+        entry: Entry yielded by os.scandir()
+        
+    Returns:
+        Dictionary with file information
+    """
+    try:
+        st = entry.stat()
+    except FileNotFoundError:
+        return {"error": "File does not exist"}
+    
+    return {
+        "name": entry.name,
+        "size": st.st_size,
+        "modified": st.st_mtime,
+        "extension": Path(entry.name).suffix,
+        "exists": True
+    }
+
+
 # TODO: Add more utility functions as needed
 # def clean_text(text: str) -> str:
 #     """Clean and normalize text data."""
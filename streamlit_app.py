@@ -6,14 +6,17 @@ A comprehensive web interface for the AI Buddy educational system.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
+import atexit
 import json
-from typing import List, Optional, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
 # Import AI Buddy modules
 from src.ai_buddy.loader import load_activities, load_profiles
-from src.ai_buddy.persist import load_history, save_history, save_child_snapshot
+from src.ai_buddy.persist import HistoryStore, save_child_snapshot
 from src.ai_buddy.recommender import recommend_activities, explain_recommendation
 from src.ai_buddy.buddy import run_session_once, get_activity_intro, get_encouragement_and_tip
 from src.ai_buddy.evaluate import eval_qna, eval_freeform, choose_outcome_from_eval
@@ -50,17 +53,74 @@ if 'current_picks' not in st.session_state:
     st.session_state.current_picks = []
 if 'last_report_paths' not in st.session_state:
     st.session_state.last_report_paths = []
+if 'last_report_bytes' not in st.session_state:
+    st.session_state.last_report_bytes = {}
+
+
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist; changes whenever the file is rewritten."""
+    try:
+        st_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st_result.st_mtime_ns, st_result.st_size
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_activities_at(activities_sig: Optional[Tuple[int, int]]) -> List[Activity]:
+    # Activities are frozen and never changed by the app, so one list is
+    # shared by reference across reruns; keeping the same objects lets the
+    # identity-keyed scoring memos in policy keep hitting
+    return load_activities("data/activities.json")
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_profiles_at(profiles_sig: Optional[Tuple[int, int]]) -> Tuple[List[ChildProfile], Dict[str, int]]:
+    # Keyed on the file's signature, so reruns reuse the parsed profiles
+    # until it is rewritten. Each call returns a copy, so in-place skill
+    # updates during a session never leak into the cache.
+    profiles = load_profiles("data/profiles.json")
+    # Position of each child id in profiles (first one wins, like a linear scan)
+    profile_index: Dict[str, int] = {}
+    for i, p in enumerate(profiles):
+        profile_index.setdefault(p.id, i)
+    return profiles, profile_index
+
+
+# Seconds a history write waits before hitting disk, so a burst of writes
+# is saved once
+HISTORY_FLUSH_DELAY_S = 2.0
+
+
+@st.cache_resource(show_spinner=False)
+def _history_store(path: str = "data/history.json") -> HistoryStore:
+    # One in-memory history per file, shared by reference across reruns and
+    # sessions; pending writes are saved at exit
+    store = HistoryStore(path, flush_delay=HISTORY_FLUSH_DELAY_S)
+    atexit.register(store.flush)
+    return store
+
+
+def _cached_history(path: str = "data/history.json") -> List:
+    """Session history from the shared store; read-only, change it through the store."""
+    return _history_store(path).get()
+
+
+def _history_version(path: str = "data/history.json") -> int:
+    """Counter that changes whenever the stored history does; for cache keys."""
+    return _history_store(path).version
 
 
 def load_data() -> Tuple[List[Activity], List[ChildProfile], List]:
     """Load all data with error handling."""
     try:
-        activities = load_activities("data/activities.json")
-        profiles = load_profiles("data/profiles.json")
-        history = load_history("data/history.json")
-        return activities, profiles, history
+        activities = _load_activities_at(_file_sig("data/activities.json"))
+        profiles, profile_index = _load_profiles_at(_file_sig("data/profiles.json"))
+        st.session_state.profile_index = profile_index
+        return activities, profiles, _cached_history("data/history.json")
     except Exception as e:
         st.error(f"Failed to load data: {str(e)}")
+        st.session_state.profile_index = {}
         return [], [], []
 
 
@@ -77,19 +137,35 @@ def get_selected_child(profiles: List[ChildProfile]) -> Optional[ChildProfile]:
     return st.session_state.selected_child
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_report(
+    child_key: str,
+    activities_sig: Optional[Tuple[int, int]],
+    history_version: int,
+    period: str,
+    fmt: str,
+    out_dir: str,
+    _child: ChildProfile,
+    _activities: List[Activity],
+    _history: List
+) -> Tuple[List[Path], Optional[bytes]]:
+    """Generate a report once per child/data state; returns its paths and the Markdown file's bytes."""
+    report_paths = generate_parent_report(_child, _activities, _history, period=period, out_dir=out_dir, fmt=fmt)
+    md_path = next((p for p in report_paths if p.suffix == '.md'), None)
+    md_bytes = md_path.read_bytes() if md_path and md_path.exists() else None
+    return report_paths, md_bytes
+
+
 def preview_sample_report(activities: List[Activity], profiles: List[ChildProfile]):
     """Generate and display a real sample report using the actual report system."""
     if not activities or not profiles:
         return
     
     # Use selected child or default to first child
-    if st.session_state.selected_child_id:
-        child = next((p for p in profiles if p.id == st.session_state.selected_child_id), profiles[0])
-    else:
-        child = profiles[0]
+    child = profiles[st.session_state.profile_index.get(st.session_state.selected_child_id, 0)]
     
     # Load existing history
-    history = load_history("data/history.json")
+    history = _cached_history("data/history.json")
     
     # Ensure there is at least some history for the sample
     if not history or not any(session.child_id == child.id for session in history):
@@ -126,28 +202,23 @@ def preview_sample_report(activities: List[Activity], profiles: List[ChildProfil
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh sample", use_container_width=True):
+            _cached_report.clear()
             st.rerun()
     
     try:
-        # Generate the actual report
-        report_paths = generate_parent_report(
-            child, activities, synthetic_history, 
-            period="7d", out_dir="reports", fmt="md"
+        # Generate the actual report (reused across reruns until refreshed
+        # or the data changes)
+        report_paths, file_bytes = _cached_report(
+            child.model_dump_json(),
+            _file_sig("data/activities.json"),
+            _history_version("data/history.json"),
+            "7d", "md", "reports",
+            child, activities, synthetic_history
         )
         
-        # Find the markdown file
-        md_path = next((p for p in report_paths if p.suffix == '.md'), None)
-        
-        if md_path and md_path.exists():
-            # Read and display the markdown
-            with open(md_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
-            
-            st.markdown(report_content)
-            
-            # Download button
-            with open(md_path, 'rb') as f:
-                file_bytes = f.read()
+        if file_bytes is not None:
+            # Display the markdown and offer the same bytes for download
+            st.markdown(file_bytes.decode('utf-8'))
             
             st.download_button(
                 label="📥 Download Sample Report",
@@ -276,7 +347,7 @@ def render_onboarding(activities: List[Activity], profiles: List[ChildProfile]):
 def seed_demo_data():
     """Seed demo history data if empty."""
     try:
-        history = load_history("data/history.json")
+        history = _cached_history("data/history.json")
         if not history:
             # Create some demo session data
             from datetime import datetime, timedelta
@@ -305,7 +376,7 @@ def seed_demo_data():
                 attempts=demo_attempts
             )
             
-            save_history([demo_session], "data/history.json")
+            _history_store("data/history.json").replace([demo_session])
             st.success("Demo data seeded successfully!")
             st.rerun()
         else:
@@ -355,21 +426,60 @@ def run_activity_session(child: ChildProfile, activity: Activity, simulate: bool
         return "", "", {}
 
 
-def get_skill_deltas(child_before: ChildProfile, child_after: ChildProfile) -> pd.DataFrame:
-    """Get skill changes between before and after states."""
-    deltas = []
-    for skill in child_after.baseline_skills:
-        before_val = child_before.baseline_skills.get(skill, 0.0)
-        after_val = child_after.baseline_skills.get(skill, 0.0)
-        delta = after_val - before_val
-        deltas.append({
-            'Skill': skill.replace('_', ' ').title(),
-            'Before': f"{before_val:.3f}",
-            'After': f"{after_val:.3f}",
-            'Change': f"{delta:+.3f}"
-        })
+def get_skill_deltas(skills_before: Dict[str, float], skills_after: Dict[str, float]) -> pd.DataFrame:
+    """Get skill changes between before and after baseline_skills snapshots."""
+    # Built column-wise; values are rounded numbers, formatted for display
+    # by SKILL_DELTA_COLUMNS rather than per-row f-strings
+    skills = list(skills_after)
+    before_get = skills_before.get
+    before = np.fromiter((before_get(s, 0.0) for s in skills), dtype=np.float64, count=len(skills))
+    after = np.fromiter(skills_after.values(), dtype=np.float64, count=len(skills))
     
-    return pd.DataFrame(deltas)
+    return pd.DataFrame({
+        'Skill': [s.replace('_', ' ').title() for s in skills],
+        'Before': before.round(3),
+        'After': after.round(3),
+        'Change': (after - before).round(3)
+    })
+
+
+# Display formats for get_skill_deltas' numeric columns
+SKILL_DELTA_COLUMNS = {
+    'Before': st.column_config.NumberColumn(format="%.3f"),
+    'After': st.column_config.NumberColumn(format="%.3f"),
+    'Change': st.column_config.NumberColumn(format="%+.3f")
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_recs(
+    child_key: str,
+    activities_sig: Optional[Tuple[int, int]],
+    history_version: int,
+    k: int,
+    _child: ChildProfile,
+    _activities: List[Activity],
+    _history: List
+) -> List[Activity]:
+    # Keyed on the child's JSON (skills change after a session), the
+    # activities file's signature and the history store's version;
+    # underscore args are passed through unhashed. len(history) is not a
+    # usable key: an attempt can grow an existing session without changing it.
+    return recommend_activities(_child, _activities, _history, k=k)
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_explain(
+    child_key: str,
+    activity_id: str,
+    activities_sig: Optional[Tuple[int, int]],
+    history_version: int,
+    _child: ChildProfile,
+    _activity: Activity,
+    _history: List
+) -> dict:
+    # Same keying as _cached_recs, per displayed activity
+    return explain_recommendation(_child, _activity, _history)
 
 
 def render_main_app(activities: List[Activity], profiles: List[ChildProfile], history: List):
@@ -389,12 +499,7 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
         child_options = {f"{p.name} ({p.id})": p for p in profiles}
         
         # Set default index based on selected_child_id from onboarding
-        default_index = 0
-        if st.session_state.selected_child_id:
-            for i, (name, child) in enumerate(child_options.items()):
-                if child.id == st.session_state.selected_child_id:
-                    default_index = i
-                    break
+        default_index = st.session_state.profile_index.get(st.session_state.selected_child_id, 0)
         
         selected_child_name = st.selectbox(
             "Choose a child:",
@@ -484,10 +589,18 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                 if st.button("🔄 Refresh Picks"):
                     st.session_state.current_picks = []
             
+            # Cache keys shared by the recommendations and explanations below
+            child_key = child.model_dump_json()
+            activities_sig = _file_sig("data/activities.json")
+            history_version = _history_version("data/history.json")
+            
             # Get recommendations
             if not st.session_state.current_picks:
                 try:
-                    st.session_state.current_picks = recommend_activities(child, activities, history, k=3)
+                    st.session_state.current_picks = _cached_recs(
+                        child_key, activities_sig, history_version, 3,
+                        child, activities, history
+                    )
                 except Exception as e:
                     st.error(f"Failed to get recommendations: {str(e)}")
                     st.session_state.current_picks = []
@@ -507,7 +620,10 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                             # Explanation expander
                             with st.expander("Why this activity?"):
                                 try:
-                                    explanation = explain_recommendation(child, activity, history)
+                                    explanation = _cached_explain(
+                                        child_key, activity.id, activities_sig, history_version,
+                                        child, activity, history
+                                    )
                                     st.write(explanation)
                                 except Exception as e:
                                     st.error(f"Failed to get explanation: {str(e)}")
@@ -536,13 +652,17 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                     # Get selected activities
                     selected_activities = st.session_state.current_picks[:num_activities]
                     
-                    # Store original child state
-                    child_before = ChildProfile.model_validate(child.model_dump())
+                    # Snapshot the skills; they are the only state the session changes
+                    skills_before = dict(child.baseline_skills)
                     
                     # Session transcript
                     st.subheader("Session Transcript")
                     transcript_container = st.container()
                     
+                    # Attempts go into the shared store as they happen and
+                    # are written to disk once, after the last activity
+                    history_store = _history_store("data/history.json")
+                    
                     with transcript_container:
                         for i, activity in enumerate(selected_activities):
                             st.markdown(f"---")
@@ -565,10 +685,7 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                                 )
                                 
                                 # Update history
-                                history = load_history("data/history.json")
-                                from src.ai_buddy.session import append_attempt
-                                history = append_attempt(history, child.id, attempt)
-                                save_history(history, "data/history.json")
+                                history_store.append(child.id, attempt)
                                 
                                 # Update child skills
                                 delta_map = {
@@ -584,13 +701,16 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                                     new_skill = max(0.0, min(1.0, current_skill + delta))
                                     child.baseline_skills[skill] = new_skill
                     
+                    history = history_store.get()
+                    
                     # Show skill changes
                     st.subheader("Skill Changes")
-                    skill_df = get_skill_deltas(child_before, child)
-                    st.dataframe(skill_df, use_container_width=True)
+                    skill_df = get_skill_deltas(skills_before, child.baseline_skills)
+                    st.dataframe(skill_df, use_container_width=True, column_config=SKILL_DELTA_COLUMNS)
                     
                     # Save final state
                     try:
+                        history_store.flush()
                         save_child_snapshot(child, f"data/snapshots/{child.id}.json")
                         st.success("✅ Session completed! Progress saved.")
                     except Exception as e:
@@ -619,30 +739,29 @@ def render_main_app(activities: List[Activity], profiles: List[ChildProfile], hi
                     
                     st.session_state.last_report_paths = report_paths
                     
+                    # Read each file once; the bytes serve both the preview
+                    # and the download buttons
+                    report_bytes = {path: path.read_bytes() for path in report_paths if path.exists()}
+                    st.session_state.last_report_bytes = report_bytes
+                    
                     st.success(f"✅ Report generated! {len(report_paths)} file(s) created.")
                     
                     # Display markdown preview if available
                     md_path = next((p for p in report_paths if p.suffix == '.md'), None)
-                    if md_path and md_path.exists():
+                    if md_path in report_bytes:
                         st.subheader("Report Preview")
-                        with open(md_path, 'r', encoding='utf-8') as f:
-                            report_content = f.read()
-                        st.markdown(report_content)
+                        st.markdown(report_bytes[md_path].decode('utf-8'))
                     
                     # Download buttons
                     st.subheader("Download Reports")
-                    for path in report_paths:
-                        if path.exists():
-                            with open(path, 'rb') as f:
-                                file_bytes = f.read()
-                            
-                            file_label = f"Download {path.suffix.upper().replace('.', '')}"
-                            st.download_button(
-                                label=file_label,
-                                data=file_bytes,
-                                file_name=path.name,
-                                mime="text/plain" if path.suffix == '.md' else "application/json"
-                            )
+                    for path, file_bytes in report_bytes.items():
+                        file_label = f"Download {path.suffix.upper().replace('.', '')}"
+                        st.download_button(
+                            label=file_label,
+                            data=file_bytes,
+                            file_name=path.name,
+                            mime="text/plain" if path.suffix == '.md' else "application/json"
+                        )
                     
                 except Exception as e:
                     st.error(f"Failed to generate report: {str(e)}")
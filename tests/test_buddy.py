@@ -11,7 +11,10 @@ from pathlib import Path
 
 from ai_buddy.data_models import Activity, ChildProfile
 from ai_buddy.buddy import (
-    clamp,
+    SKILL_DELTAS,
+    _apply_delta,
+    _cached_load_profiles,
+    clear_caches,
     get_activity_intro,
     get_encouragement_and_tip,
     run_session,
@@ -24,14 +27,6 @@ from ai_buddy.persist import save_history, load_history
 class TestHelperFunctions:
     """Test cases for helper functions."""
     
-    def test_clamp(self):
-        """Test clamp function."""
-        assert clamp(0.5, 0.0, 1.0) == 0.5
-        assert clamp(-0.1, 0.0, 1.0) == 0.0
-        assert clamp(1.5, 0.0, 1.0) == 1.0
-        assert clamp(0.0, 0.0, 1.0) == 0.0
-        assert clamp(1.0, 0.0, 1.0) == 1.0
-    
     def test_get_activity_intro(self):
         """Test activity introduction generation."""
         activity = Activity(
@@ -95,6 +90,38 @@ class TestHelperFunctions:
         encouragement, tip = get_encouragement_and_tip("unknown")
         assert "Well done!" in encouragement
         assert "Keep practicing!" in tip
+    
+    def test_apply_delta(self):
+        """Test skill delta application with clamping and defaults."""
+        skills = {"addition": 0.99, "spelling": 0.005}
+        
+        _apply_delta(skills, ["addition", "new_skill"], SKILL_DELTAS["success"])
+        assert skills["addition"] == 1.0
+        assert skills["new_skill"] == pytest.approx(0.53)
+        
+        _apply_delta(skills, ["spelling"], SKILL_DELTAS["struggle"])
+        assert skills["spelling"] == 0.0
+        
+        # Values landing exactly on the bounds are kept
+        bounds = {"low": 0.01, "high": 0.97}
+        _apply_delta(bounds, ["low"], -0.01)
+        _apply_delta(bounds, ["high"], 0.03)
+        assert bounds["low"] == 0.0
+        assert bounds["high"] == pytest.approx(1.0)
+        
+        # Zero delta leaves the dict untouched
+        _apply_delta(skills, ["unseen"], SKILL_DELTAS["skipped"])
+        assert "unseen" not in skills
+    
+    def test_cached_load_profiles(self):
+        """Test that cached loading reuses parsed data until cleared."""
+        clear_caches()
+        first, by_id = _cached_load_profiles("data/profiles.json")
+        assert _cached_load_profiles("data/profiles.json")[0] is first
+        assert by_id[first[0].id] is first[0]
+        
+        clear_caches()
+        assert _cached_load_profiles("data/profiles.json")[0] is not first
 
 
 class TestSessionRunsWithSimulator:
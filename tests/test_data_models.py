@@ -74,7 +74,9 @@ class TestActivity:
         with pytest.raises(ValidationError) as exc_info:
             Activity(**activity_data)
         
-        assert "Estimated time must be greater than 0 minutes" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        assert errors[0]["loc"] == ("estimated_min",)
+        assert errors[0]["type"] == "greater_than"
     
     def test_empty_skills(self):
         """Test that empty skills list raises ValidationError."""
@@ -93,7 +95,9 @@ class TestActivity:
         with pytest.raises(ValidationError) as exc_info:
             Activity(**activity_data)
         
-        assert "Skills list cannot be empty" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        assert errors[0]["loc"] == ("skills",)
+        assert errors[0]["type"] == "too_short"
     
     def test_default_tags(self):
         """Test that tags default to empty list."""
@@ -194,7 +198,9 @@ class TestChildProfile:
         with pytest.raises(ValidationError) as exc_info:
             ChildProfile(**profile_data)
         
-        assert "Attention span must be greater than 0 minutes" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        assert errors[0]["loc"] == ("attention_span_min",)
+        assert errors[0]["type"] == "greater_than"
     
     def test_invalid_baseline_skills(self):
         """Test that baseline skills outside 0-1 range raises ValidationError."""
@@ -215,8 +221,11 @@ class TestChildProfile:
         with pytest.raises(ValidationError) as exc_info:
             ChildProfile(**profile_data)
         
-        error_msg = str(exc_info.value)
-        assert "must be between 0.0 and 1.0 inclusive" in error_msg
+        errors = {err["loc"]: err["type"] for err in exc_info.value.errors()}
+        assert errors == {
+            ("baseline_skills", "math"): "less_than_equal",
+            ("baseline_skills", "reading"): "greater_than_equal"
+        }
     
     def test_default_interests_and_goals(self):
         """Test that interests and goals default to empty lists."""
@@ -234,3 +243,22 @@ class TestChildProfile:
         profile = ChildProfile(**profile_data)
         assert profile.interests == []
         assert profile.goals == []
+    
+    def test_profile_is_frozen(self):
+        """Test that fields cannot be reassigned but skills can be updated in place."""
+        profile = ChildProfile(
+            id="child_007",
+            name="Grace Lee",
+            age=7,
+            grade=2,
+            learning_style="auditory",
+            attention_span_min=15,
+            reading_level="emergent",
+            baseline_skills={"reading": 0.4}
+        )
+        
+        with pytest.raises(ValidationError):
+            profile.name = "Someone Else"
+        
+        profile.baseline_skills["reading"] = 0.43
+        assert profile.baseline_skills["reading"] == 0.43
@@ -123,6 +123,54 @@ class TestEvalQna:
         assert result["correct"] is True
         assert result["score"] == 1.0
     
+    def test_qna_reports_first_matching_answer(self):
+        """Test that the reason names the first acceptable answer that matches."""
+        activity = Activity(
+            id="test_004b",
+            type="math",
+            title="Test Activity",
+            description="Test",
+            level="easy",
+            skills=["math"],
+            estimated_min=10,
+            format="qna",
+            rubric={
+                "answers": ["Seven", 7, "SEVEN", 7.5],
+                "numeric_tolerance": 0.5
+            }
+        )
+        
+        result = eval_qna(" seven ", activity)
+        assert result["correct"] is True
+        assert "acceptable answer 'Seven'" in result["reason"]
+        
+        result = eval_qna(7.4, activity)
+        assert result["correct"] is True
+        assert "acceptable answer 7 within" in result["reason"]
+        
+        # Strings and numbers are never compared with each other
+        assert eval_qna("7", activity)["correct"] is False
+    
+    def test_qna_distinguishes_int_and_float_answers(self):
+        """Test that equal-valued answers of different types are reported as written."""
+        def activity(answer):
+            return Activity(
+                id="test_004c",
+                type="math",
+                title="Test Activity",
+                description="Test",
+                level="easy",
+                skills=["math"],
+                estimated_min=10,
+                format="qna",
+                rubric={"answers": [answer]}
+            )
+        
+        int_activity, float_activity = activity(1), activity(1.0)
+        
+        assert "acceptable answer 1 within" in eval_qna(1, int_activity)["reason"]
+        assert "acceptable answer 1.0 within" in eval_qna(1, float_activity)["reason"]
+    
     def test_qna_no_answers_defined(self):
         """Test Q&A evaluation when no answers are defined."""
         activity = Activity(
@@ -272,6 +320,26 @@ class TestEvalFreeform:
         assert result["kind"] == "freeform"
         assert result["meets_min_length"] is True  # Default is 3
         assert result["score"] == 0.6
+    
+    def test_freeform_ignores_blank_segments(self):
+        """Test that runs of periods and whitespace-only segments are not counted."""
+        activity = Activity(
+            id="test_010b",
+            type="storytelling",
+            title="Test Activity",
+            description="Test",
+            level="medium",
+            skills=["writing"],
+            estimated_min=15,
+            format="freeform",
+            rubric={"min_sentences": 3}
+        )
+        
+        result = eval_freeform("One... \n . Two.  .", activity)
+        assert result["meets_min_length"] is False
+        
+        result = eval_freeform("One... \n . Two. Three", activity)
+        assert result["meets_min_length"] is True
 
 
 class TestChooseOutcomeFromEval:
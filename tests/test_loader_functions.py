@@ -133,6 +133,30 @@ class TestLoadActivities:
                 load_activities(temp_file)
         finally:
             Path(temp_file).unlink()
+    
+    def test_load_activities_reuses_until_file_changes(self, tmp_path):
+        """Test that unchanged files reuse validated activities."""
+        item = {
+            "id": "test_001",
+            "type": "math",
+            "title": "Test Activity",
+            "description": "Test description",
+            "level": "easy",
+            "skills": ["test_skill"],
+            "estimated_min": 10,
+            "format": "qna",
+            "rubric": {}
+        }
+        path = tmp_path / "activities.json"
+        path.write_text(json.dumps([item]))
+        
+        first = load_activities(str(path))
+        second = load_activities(str(path))
+        assert first is not second
+        assert second[0] is first[0]
+        
+        path.write_text(json.dumps([item, dict(item, id="test_002")]))
+        assert [a.id for a in load_activities(str(path))] == ["test_001", "test_002"]
 
 
 class TestLoadProfiles:
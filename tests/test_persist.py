@@ -6,12 +6,13 @@ This module contains tests for the data persistence functions.
 
 import pytest
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 
 from ai_buddy.data_models import ChildProfile
 from ai_buddy.session import SessionLog, ActivityAttempt
-from ai_buddy.persist import save_history, load_history, save_child_snapshot
+from ai_buddy.persist import save_history, load_history, save_child_snapshot, HistoryStore
 
 
 class TestSaveHistory:
@@ -235,6 +236,112 @@ class TestSaveChildSnapshot:
         assert data["baseline_skills"]["math"] == 0.9
 
 
+class TestHistoryStore:
+    """Test cases for HistoryStore."""
+    
+    @staticmethod
+    def _attempt(activity_id):
+        return ActivityAttempt(activity_id=activity_id, timestamp=datetime(2024, 1, 1, 10, 0), outcome="success")
+    
+    def _seeded(self, tmp_path, flush_delay=60.0):
+        path = tmp_path / "history.json"
+        save_history([SessionLog(child_id="C001", attempts=[self._attempt("a1")])], str(path))
+        return path, HistoryStore(str(path), flush_delay=flush_delay)
+    
+    def test_returned_list_unchanged_until_save(self, tmp_path):
+        """Test that appends never modify a list (or session) already handed out."""
+        path, store = self._seeded(tmp_path)
+        before = store.get()
+        before_session = before[0]
+        version = store.version
+        
+        store.append("C001", self._attempt("a2"))
+        store.append("C002", self._attempt("b1"))
+        
+        assert len(before) == 1
+        assert [a.activity_id for a in before_session.attempts] == ["a1"]
+        assert [a.activity_id for a in store.get()[0].attempts] == ["a1", "a2"]
+        assert [s.child_id for s in store.get()] == ["C001", "C002"]
+        assert store.version == version + 2
+        # Not written until the flush
+        assert len(load_history(str(path))[0].attempts) == 1
+        
+        store.flush()
+        
+        assert load_history(str(path)) == store.get()
+        assert [a.activity_id for a in before_session.attempts] == ["a1"]
+    
+    def test_delayed_flush(self, tmp_path):
+        """Test that changes are written by the background timer."""
+        path, store = self._seeded(tmp_path, flush_delay=0.01)
+        store.append("C001", self._attempt("a2"))
+        
+        deadline = time.monotonic() + 5
+        while len(load_history(str(path))[0].attempts) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert len(load_history(str(path))[0].attempts) == 2
+    
+    def test_reloads_external_rewrite(self, tmp_path):
+        """Test that a file rewritten elsewhere is reloaded when nothing is unsaved."""
+        path, store = self._seeded(tmp_path)
+        version = store.version
+        
+        save_history([], str(path))
+        
+        assert store.get() == []
+        assert store.version == version + 1
+    
+    def test_flush_refuses_to_overwrite_external_rewrite(self, tmp_path):
+        """Test that unsaved changes never clobber a file rewritten elsewhere."""
+        path, store = self._seeded(tmp_path)
+        store.append("C001", self._attempt("a2"))
+        
+        save_history([], str(path))
+        
+        with pytest.raises(OSError, match="another writer"):
+            store.flush()
+        assert load_history(str(path)) == []
+        assert store.last_error is not None
+        
+    def test_failed_delayed_flush_is_retried(self, tmp_path):
+        """Test that a failing background save is recorded and retried."""
+        blocker = tmp_path / "sub"
+        store = HistoryStore(str(blocker / "history.json"), flush_delay=0.01)
+        store.append("C001", self._attempt("a1"))
+        # A file where the parent directory should be makes every save fail
+        blocker.write_text("")
+        
+        deadline = time.monotonic() + 5
+        while store.last_error is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert isinstance(store.last_error, OSError)
+        
+        blocker.unlink()
+        deadline = time.monotonic() + 5
+        while not (blocker / "history.json").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert [s.child_id for s in load_history(str(blocker / "history.json"))] == ["C001"]
+        store.flush()
+        assert store.last_error is None
+    
+    def test_replace(self, tmp_path):
+        """Test that replace swaps the history and saves it on flush."""
+        path, store = self._seeded(tmp_path)
+        new_history = [SessionLog(child_id="C009", attempts=[self._attempt("z1")])]
+        
+        store.replace(new_history)
+        store.flush()
+        
+        assert load_history(str(path)) == new_history
+    
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file starts as empty history."""
+        store = HistoryStore(str(tmp_path / "missing.json"))
+        assert store.get() == []
+
+
 class TestPersistenceIntegration:
     """Integration tests for save and load operations."""
     
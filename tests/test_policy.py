@@ -16,6 +16,10 @@ from ai_buddy.policy import (
     time_fit,
     recency_penalty,
     total_score,
+    total_score_batch,
+    build_activity_matrix,
+    score_activity_matrix,
+    reload_weights,
     mean,
     normalize_text
 )
@@ -188,6 +192,70 @@ class TestInterestFit:
         
         score = interest_fit(activity, child)
         assert score == 0.4
+    
+    def test_interest_fit_follows_updated_interests(self):
+        """Test that cached normalization tracks changed interests and casing."""
+        activity = Activity(
+            id="test_005b",
+            type="vocab",
+            title="Test Activity",
+            description="Test",
+            level="easy",
+            skills=["vocabulary"],
+            tags=["Animals"],
+            estimated_min=10,
+            format="qna",
+            rubric={}
+        )
+        
+        child = ChildProfile(
+            id="child_005b",
+            name="Test Child",
+            age=8,
+            grade=3,
+            learning_style="visual",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"vocabulary": 0.8},
+            interests=["math"]
+        )
+        
+        assert interest_fit(activity, child) == 0.4
+        
+        child.interests.append("  ANIMALS ")
+        assert interest_fit(activity, child) == 1.0
+    
+    def test_interest_fit_after_model_copy_with_new_tags(self):
+        """Test that a copied activity with replaced tags is not served stale tags."""
+        activity = Activity(
+            id="test_005c",
+            type="vocab",
+            title="Test Activity",
+            description="Test",
+            level="easy",
+            skills=["vocabulary"],
+            tags=["words"],
+            estimated_min=10,
+            format="qna",
+            rubric={}
+        )
+        
+        child = ChildProfile(
+            id="child_005c",
+            name="Test Child",
+            age=8,
+            grade=3,
+            learning_style="visual",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"vocabulary": 0.8},
+            interests=["space"]
+        )
+        
+        assert interest_fit(activity, child) == 0.4
+        copied = activity.model_copy(update={"tags": ["Space"]})
+        assert interest_fit(copied, child) == 1.0
+        assert interest_fit(activity, child) == 0.4
 
 
 class TestStyleFit:
@@ -310,6 +378,35 @@ class TestLevelFit:
         
         score = level_fit(activity, child)
         assert score == 0.7
+    
+    def test_level_fit_uses_precomputed_mean_skill(self):
+        """Test that a passed-in mean_skill matches computing it from the child."""
+        activity = Activity(
+            id="test_009b",
+            type="math",
+            title="Test Activity",
+            description="Test",
+            level="hard",
+            skills=["addition", "subtraction"],
+            estimated_min=10,
+            format="qna",
+            rubric={}
+        )
+        
+        child = ChildProfile(
+            id="child_009b",
+            name="Test Child",
+            age=8,
+            grade=3,
+            learning_style="visual",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"addition": 0.9, "subtraction": 0.8}
+        )
+        
+        mean_skill = skill_fit(activity, child)
+        assert level_fit(activity, child, mean_skill=mean_skill) == level_fit(activity, child) == 1.0
+        assert level_fit(activity, child, mean_skill=0.3) == 0.4
 
 
 class TestTimeFit:
@@ -392,6 +489,13 @@ class TestRecencyPenalty:
         """Test recency_penalty with empty history."""
         penalty = recency_penalty("activity_001", [], recent_k=2)
         assert penalty == 0.0
+    
+    def test_recency_penalty_set_of_recent_ids(self):
+        """Test recency_penalty with a set, which is tested as-is."""
+        recent = frozenset(["activity_001", "activity_002"])
+        assert recency_penalty("activity_002", recent, recent_k=1) == 1.0
+        assert recency_penalty("activity_003", recent) == 0.0
+        assert recency_penalty("activity_001", frozenset()) == 0.0
 
 
 class TestTotalScore:
@@ -431,6 +535,107 @@ class TestTotalScore:
         assert isinstance(score, float)
         assert 0.0 <= score <= 1.0
     
+    def test_total_score_batch_matches_total_score(self):
+        """Test that batch scoring matches per-activity total_score."""
+        from ai_buddy.loader import load_activities, load_profiles
+        
+        activities = load_activities("data/activities.json")
+        history = [activities[0].id, activities[1].id]
+        
+        for child in load_profiles("data/profiles.json"):
+            expected = [total_score(a, child, history) for a in activities]
+            assert total_score_batch(activities, child, history) == pytest.approx(expected)
+        
+        assert total_score_batch([], child, history) == []
+    
+    def test_activity_matrix_scores_follow_activity_list(self):
+        """Test that matrix scoring matches total_score and tracks list changes."""
+        from ai_buddy.loader import load_activities, load_profiles
+        
+        activities = load_activities("data/activities.json")
+        child = load_profiles("data/profiles.json")[0]
+        
+        matrix = build_activity_matrix(activities)
+        assert matrix.skill_counts.shape[0] == len(activities)
+        expected = [total_score(a, child, []) for a in activities]
+        assert score_activity_matrix(matrix, child, []).tolist() == pytest.approx(expected)
+        
+        # A different list of activities must not reuse the previous matrix
+        subset = activities[::-1][:3]
+        expected = [total_score(a, child, []) for a in subset]
+        assert total_score_batch(subset, child, []) == pytest.approx(expected)
+    
+    def test_total_score_batch_memo_tracks_child_and_history(self):
+        """Test that memoized batch scores follow skill updates and new history."""
+        from ai_buddy.loader import load_activities, load_profiles
+        
+        activities = load_activities("data/activities.json")
+        child = load_profiles("data/profiles.json")[0]
+        
+        first = total_score_batch(activities, child, [])
+        assert total_score_batch(activities, child, []) == first
+        
+        history = [activities[0].id]
+        assert total_score_batch(activities, child, history)[0] < first[0]
+        
+        skill = activities[1].skills[0]
+        child.baseline_skills[skill] = 1.0 - child.baseline_skills.get(skill, 0.5)
+        expected = [total_score(a, child, []) for a in activities]
+        assert total_score_batch(activities, child, []) == pytest.approx(expected)
+    
+    def test_total_score_recent_set_matches_history(self):
+        """Test that a precomputed recent_set scores like the history scan."""
+        from ai_buddy.loader import load_activities, load_profiles
+        
+        activities = load_activities("data/activities.json")
+        child = load_profiles("data/profiles.json")[0]
+        history = [activities[0].id, activities[1].id, activities[2].id]
+        recent = frozenset(history[:2])
+        
+        for activity in activities[:4]:
+            assert total_score(activity, child, history, recent_set=recent) == pytest.approx(
+                total_score(activity, child, history)
+            )
+        assert total_score_batch(activities[:4], child, history, recent_k=3)[2] < total_score(
+            activities[2], child, history
+        )
+    
+    def test_reload_weights_applies_tuned_weights(self):
+        """Test that total_score picks up edited WEIGHTS after reload_weights."""
+        activity = Activity(
+            id="test_013",
+            type="math",
+            title="Test Activity",
+            description="Test",
+            level="easy",
+            skills=["addition"],
+            estimated_min=15,
+            format="qna",
+            rubric={}
+        )
+        
+        child = ChildProfile(
+            id="child_013",
+            name="Test Child",
+            age=8,
+            grade=3,
+            learning_style="logical",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"addition": 0.8}
+        )
+        
+        original = dict(WEIGHTS)
+        try:
+            WEIGHTS.update({k: 0.0 for k in WEIGHTS})
+            WEIGHTS["skill_fit"] = 1.0
+            reload_weights()
+            assert total_score(activity, child, []) == pytest.approx(0.8)
+            assert total_score_batch([activity], child, []) == pytest.approx([0.8])
+        finally:
+            WEIGHTS.update(original)
+            reload_weights()
+    
     def test_weights_export(self):
         """Test that WEIGHTS are exported and have correct values."""
         assert isinstance(WEIGHTS, dict)
@@ -9,8 +9,10 @@ from datetime import datetime, timedelta
 
 from ai_buddy.data_models import Activity, ChildProfile
 from ai_buddy.session import SessionLog, ActivityAttempt
-from ai_buddy.recommender import recommend_activities, explain_recommendation
+from ai_buddy.recommender import recommend_activities, explain_recommendation, explain_scores
 from ai_buddy.loader import load_activities, load_profiles
+from ai_buddy.policy import total_score
+from ai_buddy.session import recent_activity_ids
 
 
 class TestRecommendActivities:
@@ -94,6 +96,27 @@ class TestRecommendActivities:
         recommended = recommend_activities(child, [], history=None, k=3)
         assert recommended == []
     
+    def test_recommend_activities_non_positive_k(self):
+        """Test that k <= 0 returns no recommendations."""
+        activities = load_activities("data/activities.json")
+        child = load_profiles("data/profiles.json")[0]
+        
+        assert recommend_activities(child, activities, history=None, k=0) == []
+        assert recommend_activities(child, activities, history=None, k=-1) == []
+    
+    def test_recommend_activities_single_activity_skips_rescoring(self, monkeypatch):
+        """Test that a one-activity catalog is returned without the relaxed re-scoring."""
+        import ai_buddy.recommender as recommender
+        
+        activities = load_activities("data/activities.json")[:1]
+        child = load_profiles("data/profiles.json")[0]
+        calls = []
+        original = recommender.total_score_batch
+        monkeypatch.setattr(recommender, "total_score_batch", lambda *args: calls.append(args) or original(*args))
+        
+        assert recommend_activities(child, activities, history=None, k=3) == activities
+        assert len(calls) == 1
+    
     def test_recommend_activities_with_history(self):
         """Test recommendation with session history."""
         # Create test child
@@ -641,3 +664,37 @@ class TestExplainRecommendation:
         
         # Recency penalty should be 0 (no history)
         assert components["recency_penalty"]["score"] == 0.0
+    
+    def test_explain_recommendation_total_matches_total_score(self):
+        """Test that the explained total and weighted scores agree with total_score."""
+        activities = load_activities("data/activities.json")
+        profiles = load_profiles("data/profiles.json")
+        history = [
+            SessionLog(
+                child_id=profiles[0].id,
+                attempts=[
+                    ActivityAttempt(activity_id=activities[0].id, timestamp=datetime.now(), outcome="success")
+                ]
+            )
+        ]
+        recent = recent_activity_ids(history, k=2)
+        
+        for activity in activities:
+            explanation = explain_recommendation(profiles[0], activity, history=history)
+            assert explanation["total_score"] == total_score(activity, profiles[0], recent)
+            for component in explanation["component_scores"].values():
+                assert component["weighted_score"] == component["weight"] * component["score"]
+    
+    def test_explain_scores_matches_dict(self):
+        """Test that explain_scores carries the same numbers as the dict form."""
+        activities = load_activities("data/activities.json")
+        child = load_profiles("data/profiles.json")[0]
+        
+        for activity in activities:
+            explanation = explain_scores(child, activity)
+            as_dict = explain_recommendation(child, activity)
+            
+            assert explanation.as_dict() == as_dict
+            assert explanation.total_score == as_dict["total_score"]
+            assert list(explanation.scores) == [c["score"] for c in as_dict["component_scores"].values()]
+            assert list(explanation.weights) == [c["weight"] for c in as_dict["component_scores"].values()]
@@ -5,7 +5,7 @@ import json
 from unittest.mock import patch
 
 from ai_buddy.data_models import Activity, ChildProfile
-from ai_buddy.session import SessionLog, ActivityAttempt
+from ai_buddy.session import SessionLog, ActivityAttempt, fast_history
 from ai_buddy.report import generate_parent_report
 
 
@@ -246,3 +246,116 @@ def test_recommender_integration(tmp_path, sample_activities, sample_profiles, s
     assert call_args[0][1] == sample_activities  # second arg should be activities
     assert call_args[0][2] == sample_history  # third arg should be history
     assert call_args[1]['k'] == 3  # k parameter should be 3
+
+
+def test_pooled_reports_match_serial(tmp_path, monkeypatch, sample_activities, sample_profiles, sample_history):
+    from ai_buddy import report
+    
+    serial = report._generate_reports(sample_profiles, sample_activities, sample_history, "7d", str(tmp_path / "serial"), "both")
+    # The in-process path leaves nothing behind in the worker global
+    assert report._worker_args == ()
+    monkeypatch.setattr(report, "POOL_MIN_CHILDREN", 1)
+    pooled = report._generate_reports(sample_profiles, sample_activities, sample_history, "7d", str(tmp_path / "pooled"), "both")
+    
+    # Same files, in target order, with the same content
+    assert [p.name for p in pooled] == [p.name for p in serial]
+    for a, b in zip(serial, pooled):
+        assert a.read_text(encoding="utf-8") == b.read_text(encoding="utf-8")
+
+
+def test_prebuilt_index_is_used(tmp_path, sample_activities, sample_profiles, sample_history):
+    from ai_buddy import report
+    
+    child = sample_profiles[0]
+    idx = report._index_activities(sample_activities)
+    with patch("ai_buddy.report._index_activities") as mock_index:
+        with_idx = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "a"), fmt="json", idx=idx)
+    mock_index.assert_not_called()
+    
+    without_idx = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "b"), fmt="json")
+    assert with_idx[0].read_text(encoding="utf-8") == without_idx[0].read_text(encoding="utf-8")
+
+
+def test_json_report_same_without_orjson(tmp_path, monkeypatch, sample_activities, sample_profiles, sample_history):
+    from ai_buddy import report
+    
+    child = sample_profiles[0]
+    default = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "a"), fmt="json")
+    monkeypatch.setattr(report, "orjson", None)
+    stdlib = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "b"), fmt="json")
+    
+    assert default[0].read_bytes() == stdlib[0].read_bytes()
+    assert "→" in stdlib[0].read_text(encoding="utf-8")
+
+
+def test_sessions_by_child_report_matches_full_scan(tmp_path, sample_activities, sample_profiles, sample_history):
+    from ai_buddy import report
+    
+    by_child = report._sessions_by_child(fast_history(sample_history))
+    assert sum(len(v) for v in by_child.values()) == len(sample_history)
+    
+    for child in sample_profiles:
+        sessions = by_child.get(child.id, [])
+        assert all(s.child_id == child.id for s in sessions)
+        grouped = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "a"), fmt="json", sessions=sessions)
+        scanned = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "b"), fmt="json")
+        assert grouped[0].read_bytes() == scanned[0].read_bytes()
+
+
+def test_report_accepts_real_sessions(tmp_path, sample_activities, sample_profiles, sample_history):
+    from ai_buddy import report
+    
+    for child in sample_profiles:
+        sessions = [s for s in sample_history if s.child_id == child.id]
+        passed = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "a"), fmt="json", sessions=sessions)
+        scanned = report.generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "b"), fmt="json")
+        assert passed[0].read_bytes() == scanned[0].read_bytes()
+    
+    # Naive timestamps in passed sessions are compared as UTC, not rejected
+    child = sample_profiles[0]
+    naive = [SessionLog(child_id=child.id, attempts=[
+        ActivityAttempt(activity_id=sample_activities[0].id, timestamp=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1), outcome="success")
+    ])]
+    passed = report.generate_parent_report(child, sample_activities, naive, out_dir=str(tmp_path / "c"), fmt="json", sessions=naive)
+    scanned = report.generate_parent_report(child, sample_activities, naive, out_dir=str(tmp_path / "d"), fmt="json")
+    assert passed[0].read_bytes() == scanned[0].read_bytes()
+
+
+def test_naive_timestamps_treated_as_utc(tmp_path, sample_activities, sample_profiles, sample_history):
+    naive_history = [
+        SessionLog(
+            child_id=s.child_id,
+            attempts=[a.model_copy(update={"timestamp": a.timestamp.replace(tzinfo=None)}) for a in s.attempts]
+        )
+        for s in sample_history
+    ]
+    child = sample_profiles[0]
+    
+    aware = generate_parent_report(child, sample_activities, sample_history, out_dir=str(tmp_path / "a"), fmt="json")
+    naive = generate_parent_report(child, sample_activities, naive_history, out_dir=str(tmp_path / "b"), fmt="json")
+    
+    js = json.loads(naive[0].read_text(encoding="utf-8"))
+    assert js["lifetime_fallback"] is False
+    assert aware[0].read_bytes() == naive[0].read_bytes()
+
+
+def test_interests_engaged_case_insensitive_and_capped(sample_activities):
+    from ai_buddy import report
+    
+    child = ChildProfile(
+        id="C009", name="Kid", age=7, grade=2, learning_style="visual", attention_span_min=15,
+        reading_level="on_grade", baseline_skills={}, interests=["Dinosaurs", "MATH", "space", "art"]
+    )
+    acts = [
+        Activity(id="T1", type="math", title="t", description="d", level="easy", skills=["addition"],
+                 tags=["Space", "dinosaurs"], estimated_min=5, format="qna", rubric={}),
+        Activity(id="T2", type="creativity", title="t", description="d", level="easy", skills=["drawing"],
+                 tags=["ART"], estimated_min=5, format="freeform", rubric={}),
+    ]
+    idx = {a.id: a for a in acts}
+    now = datetime.now(timezone.utc)
+    attempts = [ActivityAttempt(activity_id=aid, timestamp=now, outcome="success") for aid in ("T1", "T1", "missing", "T2")]
+    
+    # Sorted, lowercased, at most three
+    assert report._interests_engaged(child, attempts, idx) == ["art", "dinosaurs", "math"]
+    assert report._interests_engaged(child, attempts[:2], idx) == ["dinosaurs", "math", "space"]
@@ -5,11 +5,13 @@ This module contains tests for the session management functions.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from ai_buddy.session import (
     ActivityAttempt,
     SessionLog,
+    OUTCOMES,
+    fast_history,
     recent_activity_ids,
     append_attempt
 )
@@ -202,6 +204,88 @@ class TestRecentActivityIds:
         
         recent_ids = recent_activity_ids([session], 5)
         assert recent_ids == ["activity_001"]
+    
+    def test_recent_activity_ids_mixed_timezones(self):
+        """Test that naive (treated as UTC) and aware timestamps are ordered together."""
+        base = datetime(2024, 1, 1, 12, 0)
+        session = SessionLog(
+            child_id="child_001",
+            attempts=[
+                ActivityAttempt(activity_id="naive_old", timestamp=base, outcome="success"),
+                ActivityAttempt(
+                    activity_id="aware_new",
+                    timestamp=(base + timedelta(hours=1)).replace(tzinfo=timezone.utc),
+                    outcome="partial"
+                ),
+                ActivityAttempt(activity_id="naive_newest", timestamp=base + timedelta(hours=2), outcome="struggle")
+            ]
+        )
+        
+        assert recent_activity_ids([session], 2) == ["naive_newest", "aware_new"]
+
+
+class TestFastHistory:
+    """Test cases for fast_history function."""
+    
+    def test_fast_history_preserves_fields(self):
+        """Test that the tuple view mirrors sessions and works with history helpers."""
+        now = datetime.now()
+        history = [
+            SessionLog(
+                child_id="child_001",
+                attempts=[
+                    ActivityAttempt(activity_id="activity_001", timestamp=now - timedelta(hours=1), outcome="success"),
+                    ActivityAttempt(activity_id="activity_002", timestamp=now, outcome="partial")
+                ]
+            ),
+            SessionLog(child_id="child_002")
+        ]
+        
+        fast = fast_history(history)
+        
+        assert [s.child_id for s in fast] == ["child_001", "child_002"]
+        assert [(a.activity_id, a.timestamp, a.outcome) for a in fast[0].attempts] == [
+            (a.activity_id, a.timestamp.replace(tzinfo=timezone.utc), a.outcome) for a in history[0].attempts
+        ]
+        assert [OUTCOMES[a.outcome_code] for a in fast[0].attempts] == ["success", "partial"]
+        assert fast[1].attempts == ()
+        assert recent_activity_ids(fast, 2) == recent_activity_ids(history, 2)
+    
+    def test_fast_history_passes_converted_sessions_through(self):
+        """Test that already converted sessions are returned as they are."""
+        history = [
+            SessionLog(
+                child_id="child_001",
+                attempts=[ActivityAttempt(activity_id="activity_001", timestamp=datetime(2024, 1, 1), outcome="success")]
+            )
+        ]
+        fast = fast_history(history)
+        
+        again = fast_history(fast + history)
+        
+        assert again[0] is fast[0]
+        assert again[1] == fast[0]
+    
+    def test_fast_history_normalizes_timestamps_to_utc(self):
+        """Test that naive timestamps become UTC and aware ones are kept."""
+        naive = datetime(2024, 1, 1, 10, 0)
+        aware = datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+        history = [
+            SessionLog(
+                child_id="child_001",
+                attempts=[
+                    ActivityAttempt(activity_id="activity_001", timestamp=naive, outcome="success"),
+                    ActivityAttempt(activity_id="activity_002", timestamp=aware, outcome="partial")
+                ]
+            )
+        ]
+        
+        attempts = fast_history(history)[0].attempts
+        
+        assert attempts[0].timestamp == naive.replace(tzinfo=timezone.utc)
+        assert attempts[1].timestamp is aware
+        # The models themselves are left as they were
+        assert history[0].attempts[0].timestamp.tzinfo is None
 
 
 class TestAppendAttempt:
@@ -4,11 +4,16 @@ Tests for the simulate module.
 This module contains tests for the simulation functions.
 """
 
+import os
+import random
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import patch
 
 from ai_buddy.data_models import Activity, ChildProfile
-from ai_buddy.simulate import answer
+from ai_buddy.simulate import answer, answer_batch
 
 
 class TestAnswer:
@@ -343,3 +348,113 @@ class TestAnswer:
         result1 = answer(child, activity)
         result2 = answer(child, activity)
         assert result1 == result2
+    
+    def test_answer_leaves_global_random_state(self):
+        """Test that answering does not reseed the module-level generator."""
+        child = ChildProfile(
+            id="test_child_rng",
+            name="Test Child",
+            age=8,
+            grade=3,
+            interests=[],
+            learning_style="visual",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"math": 0.8},
+            goals=[]
+        )
+        
+        activity = Activity(
+            id="test_001",
+            type="math",
+            title="Test Math",
+            description="Test activity",
+            level="easy",
+            skills=["math"],
+            estimated_min=10,
+            format="qna",
+            rubric={"answers": ["4"]}
+        )
+        
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        answer(child, activity)
+        assert random.random() == expected
+    
+    def test_answer_stable_across_processes(self):
+        """Test that answers do not depend on the per-process string hash seed."""
+        code = (
+            "from ai_buddy.data_models import Activity, ChildProfile\n"
+            "from ai_buddy.simulate import answer\n"
+            "child = ChildProfile(id='c', name='n', age=8, grade=3, learning_style='visual', "
+            "attention_span_min=20, reading_level='on_grade', baseline_skills={'math': 0.5})\n"
+            "for i in range(20):\n"
+            "    a = Activity(id=f'a{i}', type='math', title='t', description='d', level='easy', "
+            "skills=['math'], estimated_min=10, format='qna', rubric={'answers': ['4', 'four']})\n"
+            "    print(answer(child, a))\n"
+        )
+        outputs = []
+        for hash_seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+            result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+            outputs.append(result.stdout)
+        assert outputs[0] == outputs[1]
+
+
+class TestAnswerBatch:
+    """Test cases for answer_batch function."""
+    
+    @pytest.fixture
+    def child(self):
+        return ChildProfile(
+            id="test_child_batch",
+            name="Test Child",
+            age=8,
+            grade=3,
+            interests=[],
+            learning_style="visual",
+            attention_span_min=20,
+            reading_level="on_grade",
+            baseline_skills={"math": 0.9, "writing": 0.2},
+            goals=[]
+        )
+    
+    @pytest.fixture
+    def activities(self):
+        qna = [
+            Activity(
+                id=f"qna_{i}", type="math", title="Math", description="Test activity", level="easy",
+                skills=["math"], estimated_min=10, format="qna", rubric={"answers": ["4", "four", 4]}
+            )
+            for i in range(20)
+        ]
+        fallback = Activity(
+            id="qna_fallback", type="logic", title="Logic", description="Test activity", level="easy",
+            skills=["math"], estimated_min=10, format="qna", rubric={"answers": [4]}
+        )
+        freeform = Activity(
+            id="free_1", type="storytelling", title="Story", description="Test activity", level="medium",
+            skills=["writing"], estimated_min=15, format="freeform",
+            rubric={"min_sentences": 5, "keywords": ["dragon"]}
+        )
+        return qna + [fallback, freeform]
+    
+    def test_one_answer_per_activity(self, child, activities):
+        """Test that answers come back in activity order with valid values."""
+        answers = answer_batch(child, activities)
+        
+        assert len(answers) == len(activities)
+        assert set(answers[:20]) <= {"4", "four", "wrong answer"}
+        assert answers[20] in ("true", "wrong answer")
+        assert answers[21].startswith("This is sentence 1 of my story.")
+        assert answers[21].count("of my story.") == 5
+    
+    def test_repeatable_for_seed(self, child, activities):
+        """Test that the same child and seed give the same batch."""
+        assert answer_batch(child, activities) == answer_batch(child, activities)
+        assert answer_batch(child, activities, seed=7) == answer_batch(child, activities, seed=7)
+    
+    def test_empty_batch(self, child):
+        """Test that an empty batch returns no answers."""
+        assert answer_batch(child, []) == []
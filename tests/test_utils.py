@@ -0,0 +1,430 @@
+"""
+Tests for the utils module.
+
+This module contains tests for the helper functions and utilities.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import re
+
+import pytest
+
+from ai_buddy import utils
+from ai_buddy.data_models import Activity, ChildProfile
+from ai_buddy.utils import (
+    generate_id,
+    generate_ids,
+    validate_data_path,
+    validate_data_path_str,
+    save_records_to_json,
+    load_records_from_json,
+    save_records_to_json_columnar,
+    load_records_from_json_columnar,
+    save_records_to_msgpack,
+    load_records_from_msgpack,
+    get_file_info,
+    get_file_info_from_entry
+)
+
+
+@pytest.fixture
+def records():
+    return [
+        Activity(
+            id=f"math_{i:03d}",
+            type="math",
+            title=f"Count to {i} — café",
+            description="Count objects",
+            level="easy",
+            skills=["counting"],
+            estimated_min=5,
+            format="qna",
+            rubric={"answers": [i, str(i)]}
+        )
+        for i in range(3)
+    ]
+
+
+class TestGenerateId:
+    """Test cases for generate_id function."""
+    
+    def test_generate_id_format(self):
+        """Test that IDs are the prefix plus 8 hex characters."""
+        record_id = generate_id("hello", prefix="rec")
+        prefix, digest = record_id.split("_")
+        assert prefix == "rec"
+        assert len(digest) == 8
+        int(digest, 16)
+    
+    def test_generate_id_deterministic(self):
+        """Test that the same content gives the same ID and different content differs."""
+        assert generate_id("hello") == generate_id("hello")
+        assert generate_id("hello") != generate_id("world")
+    
+    def test_generate_id_uses_sha256_prefix(self):
+        """Test that the ID is the first 8 hex characters of the SHA-256 digest."""
+        assert generate_id("hello", prefix="rec") == "rec_2cf24dba"
+    
+    def test_generate_id_long_content_not_cached(self):
+        """Test that long content gets the same ID without entering the cache."""
+        long_content = "x" * (utils._ID_CACHE_MAX_LEN + 1)
+        utils._cached_hash_id.cache_clear()
+        
+        assert generate_id(long_content) == generate_id(long_content) == utils._hash_id(long_content, "record")
+        assert generate_id("short") == utils._hash_id("short", "record")
+        assert utils._cached_hash_id.cache_info().currsize == 1
+    
+    def test_bytes_content(self):
+        """Test that bytes-like content gives the same ID as the decoded str."""
+        text = "héllo"
+        data = text.encode()
+        expected = generate_id(text, "act")
+        
+        assert generate_id(data, "act") == expected
+        assert generate_id(bytearray(data), "act") == expected
+        assert generate_id(memoryview(data), "act") == expected
+    
+    def test_batch_matches_single(self):
+        """Test that batch IDs match generate_id item by item."""
+        contents = ["hello", "", "é" * 3, "x" * 5000, "hello"]
+        assert generate_ids(contents, "act") == [generate_id(c, "act") for c in contents]
+        assert generate_ids([]) == []
+
+
+class TestValidateDataPath:
+    """Test cases for validate_data_path function."""
+    
+    def test_existing_file(self, tmp_path):
+        """Test that an existing file is returned as a Path."""
+        path = tmp_path / "data.json"
+        path.write_text("[]")
+        assert validate_data_path(str(path)) == path
+    
+    def test_missing_path(self, tmp_path):
+        """Test that a missing path raises ValueError."""
+        with pytest.raises(ValueError, match="does not exist"):
+            validate_data_path(tmp_path / "missing.json")
+    
+    def test_directory(self, tmp_path):
+        """Test that a directory raises ValueError."""
+        with pytest.raises(ValueError, match="not a file"):
+            validate_data_path(tmp_path)
+    
+    def test_str_variant(self, tmp_path):
+        """Test that the str variant returns the path unchanged and validates the same way."""
+        path = tmp_path / "data.json"
+        path.write_text("[]")
+        assert validate_data_path_str(str(path)) == str(path)
+        with pytest.raises(ValueError, match="does not exist"):
+            validate_data_path_str(str(tmp_path / "missing.json"))
+        with pytest.raises(ValueError, match="not a file"):
+            validate_data_path_str(str(tmp_path))
+    
+    def test_single_stat_call(self, tmp_path, monkeypatch):
+        """Test that validation stats the path only once."""
+        path = tmp_path / "data.json"
+        path.write_text("[]")
+        calls = []
+        real_stat = os.stat
+        monkeypatch.setattr(utils.os, "stat", lambda p, *a, **kw: calls.append(p) or real_stat(p, *a, **kw))
+        
+        validate_data_path(path)
+        
+        assert len(calls) == 1
+
+
+class TestSaveRecordsToJson:
+    """Test cases for save_records_to_json function."""
+    
+    def test_save_records(self, tmp_path, records):
+        """Test that records are written as a JSON list of their dumps."""
+        path = tmp_path / "records.json"
+        save_records_to_json(records, path)
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == [r.model_dump() for r in records]
+    
+    def test_save_records_keeps_subclass_fields(self, tmp_path, records):
+        """Test that mixed record models are each written with all their fields."""
+        profile = ChildProfile(
+            id="C001", name="Ana", age=7, grade=2, learning_style="visual", attention_span_min=15,
+            reading_level="on_grade", baseline_skills={"counting": 0.5}
+        )
+        path = tmp_path / "records.json"
+        save_records_to_json([records[0], profile], path)
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == [records[0].model_dump(), profile.model_dump()]
+    
+    def test_save_records_compact_by_default(self, tmp_path, records):
+        """Test that output is compact unless pretty is requested."""
+        compact = tmp_path / "compact.json"
+        pretty = tmp_path / "pretty.json"
+        save_records_to_json(records, compact)
+        save_records_to_json(records, pretty, pretty=True)
+        
+        assert b"\n" not in compact.read_bytes()
+        assert pretty.read_bytes().startswith(b"[\n  {")
+        assert json.loads(compact.read_bytes()) == json.loads(pretty.read_bytes())
+    
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_save_records_in_chunks_matches_single_dump(self, tmp_path, monkeypatch, records, pretty):
+        """Test that chunked writing produces the same file as one dump."""
+        single = tmp_path / "single.json"
+        chunked = tmp_path / "chunked.json"
+        many = records * 5
+        save_records_to_json(many, single, pretty=pretty)
+        monkeypatch.setattr(utils, "_SAVE_CHUNK", 4)
+        save_records_to_json(many, chunked, pretty=pretty)
+        
+        assert chunked.read_bytes() == single.read_bytes()
+        assert load_records_from_json(chunked, Activity) == many
+
+
+class TestLoadRecordsFromJson:
+    """Test cases for load_records_from_json function."""
+    
+    def test_roundtrip(self, tmp_path, records):
+        """Test that saved records load back as equal models."""
+        path = tmp_path / "records.json"
+        save_records_to_json(records, path)
+        
+        assert load_records_from_json(path, Activity) == records
+    
+    def test_roundtrip_large_file(self, tmp_path, records):
+        """Test a file well beyond one 64 KB read buffer."""
+        many = [r.model_copy(update={"id": f"math_{i:05d}"}) for i in range(1500) for r in records[:1]]
+        path = tmp_path / "records.json"
+        save_records_to_json(many, path)
+        
+        assert path.stat().st_size > 256 * 1024
+        assert load_records_from_json(path, Activity) == many
+    
+    def test_invalid_json(self, tmp_path):
+        """Test that malformed JSON raises ValueError."""
+        path = tmp_path / "records.json"
+        path.write_text("invalid json content")
+        
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            load_records_from_json(path, Activity)
+    
+    def test_invalid_schema(self, tmp_path):
+        """Test that records not matching the model raise ValueError."""
+        path = tmp_path / "records.json"
+        path.write_text(json.dumps([{"invalid": "data"}]))
+        
+        with pytest.raises(ValueError, match="Failed to load records"):
+            load_records_from_json(path, Activity)
+
+
+class TestColumnarRecords:
+    """Test cases for columnar JSON record save/load."""
+    
+    def test_roundtrip(self, tmp_path, records):
+        """Test that records are written one list per field and load back equal."""
+        path = tmp_path / "records.json"
+        save_records_to_json_columnar(records, path)
+        
+        columns = json.loads(path.read_bytes())
+        assert list(columns) == list(Activity.model_fields)
+        assert columns["id"] == [r.id for r in records]
+        assert load_records_from_json_columnar(path, Activity) == records
+    
+    def test_empty(self, tmp_path):
+        """Test that an empty list round-trips."""
+        path = tmp_path / "records.json"
+        save_records_to_json_columnar([], path)
+        
+        assert json.loads(path.read_bytes()) == {}
+        assert load_records_from_json_columnar(path, Activity) == []
+    
+    def test_mixed_models(self, tmp_path, records):
+        """Test that records of different models are rejected."""
+        profile = ChildProfile(
+            id="C001", name="Ana", age=7, grade=2, learning_style="visual", attention_span_min=15,
+            reading_level="on_grade", baseline_skills={"counting": 0.5}
+        )
+        with pytest.raises(ValueError, match="same model"):
+            save_records_to_json_columnar([records[0], profile], tmp_path / "records.json")
+    
+    def test_ragged_columns(self, tmp_path):
+        """Test that columns of different lengths raise ValueError."""
+        path = tmp_path / "records.json"
+        path.write_text('{"id": ["a", "b"], "type": ["math"]}')
+        with pytest.raises(ValueError, match="different lengths"):
+            load_records_from_json_columnar(path, Activity)
+    
+    def test_invalid_json(self, tmp_path):
+        """Test that malformed JSON raises ValueError."""
+        path = tmp_path / "records.json"
+        path.write_text("{not json")
+        with pytest.raises(ValueError, match="Invalid JSON in"):
+            load_records_from_json_columnar(path, Activity)
+
+
+class TestMsgpackRecords:
+    """Test cases for save_records_to_msgpack and load_records_from_msgpack."""
+    
+    def test_roundtrip(self, tmp_path, records):
+        """Test that records saved as MessagePack load back as equal models."""
+        pytest.importorskip("ormsgpack")
+        path = tmp_path / "records.msgpack"
+        save_records_to_msgpack(records, path)
+        
+        assert load_records_from_msgpack(path, Activity) == records
+        assert path.stat().st_size < len(json.dumps([r.model_dump() for r in records]))
+    
+    def test_invalid_data(self, tmp_path):
+        """Test that malformed MessagePack raises ValueError."""
+        pytest.importorskip("ormsgpack")
+        path = tmp_path / "records.msgpack"
+        path.write_bytes(b"\xc1")
+        
+        with pytest.raises(ValueError, match="Invalid MessagePack"):
+            load_records_from_msgpack(path, Activity)
+    
+    def test_requires_ormsgpack(self, tmp_path, monkeypatch, records):
+        """Test that a missing ormsgpack raises ImportError naming the extra."""
+        monkeypatch.setattr(utils, "ormsgpack", None)
+        
+        with pytest.raises(ImportError, match="msgpack"):
+            save_records_to_msgpack(records, tmp_path / "records.msgpack")
+        with pytest.raises(ImportError, match="msgpack"):
+            load_records_from_msgpack(tmp_path / "records.msgpack", Activity)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    utils._stop_log_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging function."""
+    
+    def test_epoch_formatter(self):
+        """Test that the fast formatter stamps epoch seconds."""
+        record = logging.LogRecord("ai_buddy", logging.INFO, __file__, 1, "hello", None, None)
+        record.created = 1700000000.25
+        
+        line = utils._epoch_formatter_class()(utils._LOG_FORMAT).format(record)
+        
+        assert line == "1700000000.250 - ai_buddy - INFO - hello"
+    
+    def test_fast_mode_skips_thread_and_process_info(self, monkeypatch):
+        """Test that fast mode turns off thread/process collection and sets formatters."""
+        for flag in ("logThreads", "logProcesses", "logMultiprocessing"):
+            monkeypatch.setattr(logging, flag, True)
+        configured = {}
+        monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: configured.update(kwargs))
+        
+        utils.setup_logging("DEBUG", fast=True)
+        listener_handlers = utils._log_listener.handlers
+        utils._stop_log_listener()
+        
+        assert not (logging.logThreads or logging.logProcesses or logging.logMultiprocessing)
+        assert configured["level"] == logging.DEBUG
+        assert all(isinstance(h.formatter, utils._epoch_formatter_class()) for h in listener_handlers)
+        
+        # A later non-fast call restores the process-wide flags
+        utils.setup_logging("DEBUG")
+        utils._stop_log_listener()
+        
+        assert logging.logThreads and logging.logProcesses and logging.logMultiprocessing
+    
+    def test_records_written_by_background_listener(self, tmp_path, monkeypatch):
+        """Test that the root logger only queues records and the listener writes them."""
+        configured = {}
+        monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: configured.update(kwargs))
+        log_file = tmp_path / "app.log"
+        
+        utils.setup_logging("INFO", log_file=str(log_file))
+        (queue_handler,) = configured["handlers"]
+        file_handler = utils._log_listener.handlers[-1]
+        assert isinstance(queue_handler, logging.handlers.QueueHandler)
+        
+        record = logging.LogRecord("ai_buddy", logging.INFO, __file__, 1, "queued %s", ("msg",), None)
+        queue_handler.handle(record)
+        utils._stop_log_listener()
+        file_handler.close()
+        
+        assert log_file.read_text().rstrip().endswith(" - ai_buddy - INFO - queued msg")
+        assert utils._log_listener is None
+    
+    def test_second_call_replaces_first_end_to_end(self, tmp_path, restore_root_logger):
+        """Test real logging through two setup_logging calls, each line formatted once."""
+        first_file = tmp_path / "first.log"
+        second_file = tmp_path / "second.log"
+        logger = logging.getLogger("ai_buddy.e2e")
+        
+        utils.setup_logging("INFO", log_file=str(first_file))
+        logger.warning("first %s", "call")
+        utils.setup_logging("INFO", log_file=str(second_file))
+        logger.warning("second")
+        utils._stop_log_listener()
+        
+        timestamp = r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3}"
+        assert re.fullmatch(timestamp + r" - ai_buddy\.e2e - WARNING - first call\n", first_file.read_text())
+        assert re.fullmatch(timestamp + r" - ai_buddy\.e2e - WARNING - second\n", second_file.read_text())
+        assert len(logging.getLogger().handlers) == 1
+
+
+class TestGetFileInfo:
+    """Test cases for get_file_info function."""
+    
+    def test_existing_file(self, tmp_path):
+        """Test file information for an existing file."""
+        path = tmp_path / "data.json"
+        path.write_text("[1, 2, 3]")
+        
+        info = get_file_info(path)
+        
+        assert info["name"] == "data.json"
+        assert info["size"] == 9
+        assert info["modified"] == path.stat().st_mtime
+        assert info["extension"] == ".json"
+        assert info["exists"] is True
+    
+    def test_missing_file(self, tmp_path):
+        """Test file information for a missing file."""
+        assert get_file_info(tmp_path / "missing.json") == {"error": "File does not exist"}
+    
+    def test_single_stat_call(self, tmp_path, monkeypatch):
+        """Test that file information costs one stat call."""
+        path = tmp_path / "data.json"
+        path.write_text("[]")
+        calls = []
+        real_stat = os.stat
+        monkeypatch.setattr(os, "stat", lambda *args, **kwargs: calls.append(args) or real_stat(*args, **kwargs))
+        
+        assert get_file_info(path)["size"] == 2
+        assert len(calls) == 1
+
+
+class TestGetFileInfoFromEntry:
+    """Test cases for get_file_info_from_entry function."""
+    
+    def test_matches_get_file_info(self, tmp_path):
+        """Test that scandir entries give the same info as get_file_info."""
+        for name in ("records.json", "notes.tar.gz", "README", "foo.", ".hidden", "..dots", "a..b"):
+            (tmp_path / name).write_text("data")
+        
+        with os.scandir(tmp_path) as entries:
+            infos = {e.name: get_file_info_from_entry(e) for e in entries}
+        
+        assert infos == {p.name: get_file_info(p) for p in tmp_path.iterdir()}
+    
+    def test_removed_file(self, tmp_path):
+        """Test that a file removed after listing reports an error."""
+        path = tmp_path / "gone.json"
+        path.write_text("[]")
+        with os.scandir(tmp_path) as entries:
+            (entry,) = list(entries)
+        path.unlink()
+        
+        assert get_file_info_from_entry(entry) == {"error": "File does not exist"}